@@ -2,7 +2,7 @@ from datetime import datetime, timedelta, timezone
 import logging
 
 import asyncio
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 from starlette.responses import StreamingResponse
 
 from fastapi import FastAPI, APIRouter, Depends, Query, WebSocket, Request, Response
@@ -20,7 +20,7 @@ from fastapi_deprecation.metrics import DeprecationTracker, InMemoryMetricsStore
 # ---------------------------------------------------------
 # Setup: Telemetry Logging
 # ---------------------------------------------------------
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger("api.telemetry")
 
 
@@ -29,10 +29,15 @@ def log_deprecation_usage(
     request: Request, response: Response, dep: DeprecationDependency | DeprecationConfig
 ):
     """Log when a client accesses a deprecated endpoint."""
-    logger.warning(
-        f"DEPRECATED USAGE: ⚠ Client accessed {request.url.path} "
-        f"{f'(Sunset: {dep.sunset_date})' if dep.sunset_date else ''}"
-    )
+    # Lazy %-style args: the message is only formatted if the record is emitted
+    if dep.sunset_date:
+        logger.warning(
+            "DEPRECATED USAGE: ⚠ Client accessed %s (Sunset: %s)",
+            request.url.path,
+            dep.sunset_date,
+        )
+    else:
+        logger.warning("DEPRECATED USAGE: ⚠ Client accessed %s", request.url.path)
 
 
 set_deprecation_callback(log_deprecation_usage)
@@ -57,14 +62,15 @@ deprecation_future = now + timedelta(days=10)
 v1_app = FastAPI(title="Showcase API v1", description="Legacy API (Sunset)")
 
 
+# Return annotations let FastAPI serialize straight to JSON via Pydantic
 @v1_app.get("/users")
-async def get_users_v1():
+async def get_users_v1() -> list[dict[str, Any]]:
     # Because of middleware, you won't actually be able to hit this if sunset_date has passed
     return [{"id": 1, "name": "Alice", "v": 1}, {"id": 2, "name": "Bob", "v": 1}]
 
 
 @v1_app.get("/products")
-async def get_products_v1():
+async def get_products_v1() -> list[dict[str, Any]]:
     return [{"id": 101, "name": "Widget", "v": 1}]
 
 
@@ -90,7 +96,7 @@ v2_router = APIRouter(
 
 # Entire router deprecated with dependency. Still active, but warns
 @v2_router.get("/users")
-async def get_users_v2(active_only: bool = True):
+async def get_users_v2(active_only: bool = True) -> list[dict[str, Any]]:
     """Entire router deprecated with dependency. Still active, but emits warnings headers."""
     return [
         {"id": 1, "name": "Alice", "schema": "v2"},
@@ -100,7 +106,7 @@ async def get_users_v2(active_only: bool = True):
 
 # Entire router deprecated with dependency. Still active, but warns
 @v2_router.get("/products")
-async def get_products_v2():
+async def get_products_v2() -> list[dict[str, Any]]:
     """Entire router deprecated with dependency. Still active, but emits warnings headers."""
     return [{"id": 101, "name": "Super Widget", "schema": "v2"}]
 
@@ -114,7 +120,9 @@ v3_router = APIRouter(prefix="/v3", tags=["v3 - Current API"])
 
 # A fully active, modern endpoint
 @v3_router.get("/users")
-async def get_users_v3(status: str = Query("active", description="Filter by status")):
+async def get_users_v3(
+    status: str = Query("active", description="Filter by status"),
+) -> dict[str, Any]:
     """A fully active, modern endpoint"""
     return {
         "data": [
@@ -135,14 +143,14 @@ async def get_users_v3(status: str = Query("active", description="Filter by stat
     ],
     detail="Legacy reports are undergoing scheduled maintenance (brownout) to simulate final shutdown.",
 )
-async def legacy_reports():
+async def legacy_reports() -> dict[str, Any]:
     """Endpoint with alternative and undergoing scheduled maintenance (brownout) to simulate final shutdown."""
     return {"report_data": "Lots of unstructured data in a bad format"}
 
 
 # The modern, active reports endpoint that legacy redirects to.
 @v3_router.get("/reports/modern")
-async def modern_reports():
+async def modern_reports() -> dict[str, Any]:
     """The modern, active reports endpoint that legacy redirects to."""
     return {"report_data": {"structured": True, "format": "JSON"}}
 
@@ -164,7 +172,7 @@ custom_sunset_response = JSONResponse(
     sunset_date=sunset_past.isoformat(),  # Sunset has already passed!
     response=custom_sunset_response,
 )
-async def export_xml():
+async def export_xml() -> str:
     """Endpoint using a Custom Response Model, sunset has already passed"""
     return "<data><item>You should not see this</item></data>"
 
@@ -176,7 +184,7 @@ async def export_xml():
     sunset_date=(now + timedelta(days=365)).isoformat(),
     detail="Switch to OAuth2 soon.",
 )
-async def legacy_auth():
+async def legacy_auth() -> dict[str, str]:
     """Endpoint announcing an Upcoming Deprecation"""
     return {"token": "insecure-legacy-token"}
 
@@ -192,7 +200,7 @@ async def legacy_auth():
     cache_tag="api-v3-flaky",  # Edge caching tag for instant CDN purging
     detail="This endpoint is progressively degrading. Expect probabilistic 410 Gone responses.",
 )
-async def flaky_data():
+async def flaky_data() -> dict[str, str]:
     """Endpoint demonstrating Progressive Chaos Engineering and Edge Caching"""
     return {"message": "You got lucky! The request succeeded."}
 
@@ -204,7 +212,7 @@ async def flaky_data():
     brownout_probability=0.1,  # Static 10% failure rate
     detail="This endpoint has a static 10% chance to fail.",
 )
-async def static_flaky_data():
+async def static_flaky_data() -> dict[str, str]:
     """Endpoint demonstrating Static Chaos Engineering"""
     return {"message": "You survived the 10% static brownout!"}
 
@@ -274,7 +282,7 @@ app = FastAPI(
     summary="View Deprecation Analytics",
     description="Export the aggregated usage metrics of all deprecated endpoints from the DeprecationTracker.",
 )
-async def get_metrics():
+async def get_metrics() -> dict[str, Any]:
     return await tracker.export_json()
 
 
@@ -297,7 +305,9 @@ app.include_router(v2_router)
 app.include_router(v3_router)
 
 # 4. Generate OpenAPI schemas for all endpoints (including mounts!)
-auto_deprecate_openapi(app)
+# The showcase schedule is fixed at startup, so the patched schema is built once
+# and reused instead of being regenerated on every /openapi.json request.
+auto_deprecate_openapi(app, always_rebuild=False)
 
 if __name__ == "__main__":
     import uvicorn
@@ -305,4 +315,12 @@ if __name__ == "__main__":
     print("\n--- Starting FastAPI Deprecation Showcase ---")
     print("API documentation serving at: http://127.0.0.1:8000/docs")
     print("Check out the /v1, /v2, and /v3 endpoints in the Swagger interface.\n")
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # `pip install "uvicorn[standard]"` to run on uvloop and httptools: uvicorn
+    # picks them up when installed and falls back to asyncio/h11 otherwise.
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        log_level="warning",
+        access_log=False,
+    )
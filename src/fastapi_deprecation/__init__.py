@@ -5,7 +5,11 @@ from .dependencies import DeprecationDependency
 from .core import deprecated
 from .openapi import auto_deprecate_openapi
 from .middleware import DeprecationMiddleware
-from .engine import DeprecationConfig, set_deprecation_callback
+from .engine import (
+    DeprecationConfig,
+    flush_deprecation_callbacks,
+    set_deprecation_callback,
+)
 from .sse import deprecated_sse_generator
 
 __all__ = [
@@ -15,6 +19,7 @@ __all__ = [
     "deprecated",
     "auto_deprecate_openapi",
     "set_deprecation_callback",
+    "flush_deprecation_callbacks",
     "DeprecationMiddleware",
     "DeprecationConfig",
     "deprecated_sse_generator",
@@ -1,11 +1,14 @@
 import inspect
-import functools
 from typing import Optional, Callable
 from fastapi import Request, Response, WebSocket, status
 from fastapi.concurrency import run_in_threadpool
+from starlette.responses import StreamingResponse
 
-from .dependencies import DeprecationDependency
+from .dependencies import DeprecationDependency, DeprecationSunset
+from .engine import ActionType, process_deprecation
+from .sse import deprecated_sse_generator
 from .utils import DateInput
+from .websocket import DeprecatedWebSocket
 
 
 def deprecated(
@@ -22,6 +25,7 @@ def deprecated(
     cache_tag: Optional[str] = None,
     brownout_probability: float = 0.0,
     progressive_brownout: bool = False,
+    skip_methods: frozenset[str] = frozenset({"OPTIONS"}),
 ):
     """
     Decorator to mark an endpoint as deprecated.
@@ -41,6 +45,7 @@ def deprecated(
         cache_tag (Optional[str]): Cache tag for the deprecation.
         brownout_probability (float): Probability of a brownout.
         progressive_brownout (bool): Whether to use progressive brownout.
+        skip_methods (frozenset[str]): HTTP methods passed through untouched, e.g. CORS preflights.
     """
     dep = DeprecationDependency(
         deprecation_date=deprecation_date,
@@ -56,10 +61,19 @@ def deprecated(
         cache_tag=cache_tag,
         brownout_probability=brownout_probability,
         progressive_brownout=progressive_brownout,
+        skip_methods=skip_methods,
     )
 
     def decorator(func: Callable):
-        sig = inspect.signature(func)
+        try:
+            # Resolve string annotations against the endpoint's own module so the
+            # wrapper's signature is self-contained and needs no `__wrapped__`.
+            sig = inspect.signature(func, eval_str=True)
+            resolved = True
+        except Exception:
+            # Forward references that are not importable yet; FastAPI resolves them later
+            sig = inspect.signature(func)
+            resolved = False
         params = list(sig.parameters.values())
 
         # Check if request/response already in params
@@ -67,104 +81,107 @@ def deprecated(
         has_response = any(p.name == "response" for p in params)
 
         has_varkw = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params)
+        has_websocket = any(p.name == "websocket" for p in params)
 
-        # We need to create a wrapper that accepts request/response if needed
-        # But we also need to expose them to FastAPI so it injects them.
+        # Resolved once at decoration time instead of on every request
+        is_coro = inspect.iscoroutinefunction(func)
+        strip_keys = tuple(
+            k
+            for k, present in (("request", has_request), ("response", has_response))
+            if not has_varkw and not present
+        )
+        strip_websocket = not has_varkw and not has_websocket
 
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Extract request/response/websocket from kwargs
-            req: Request = kwargs.get("request")
-            res: Response = kwargs.get("response")
+        is_websocket = any(p.annotation == WebSocket for p in params)
+
+        # Bind the sync/async call path once instead of branching per request
+        if is_coro:
+            call_endpoint = func
+        else:
+
+            def call_endpoint(*args, **kwargs):
+                return run_in_threadpool(func, *args, **kwargs)
+
+        def wrap_sse(response: Response) -> None:
+            # Auto-wrap SSE streams
+            is_sse = getattr(response, "media_type", None) == "text/event-stream"
+            if is_sse and isinstance(response, StreamingResponse):
+                response.body_iterator = deprecated_sse_generator(
+                    response.body_iterator, dep.config
+                )
+
+        # Specialized wrappers: the endpoint kind is known at decoration time, so
+        # only the relevant path is compiled into the wrapper FastAPI calls.
+        async def websocket_wrapper(*args, **kwargs):
             ws: WebSocket = kwargs.get("websocket")
 
             if ws:
-                from datetime import datetime, timezone
-                from .engine import ActionType, process_deprecation
-                from .websocket import DeprecatedWebSocket
-
-                now = datetime.now(timezone.utc)
-                result = process_deprecation(dep.config, now)
+                result = process_deprecation(dep.config)
 
                 if result.action == ActionType.BLOCK:
                     wrapper_ws = DeprecatedWebSocket(ws, result, dep.config)
                     await wrapper_ws.handle_block(dep.config)
                     return
-                else:
-                    # Provide wrapper to handler
-                    kwargs["websocket"] = DeprecatedWebSocket(ws, result, dep.config)
 
-                    if not has_varkw and not any(p.name == "websocket" for p in params):
-                        kwargs.pop("websocket", None)
+                # Provide wrapper to handler
+                kwargs["websocket"] = DeprecatedWebSocket(ws, result, dep.config)
 
-                    if inspect.iscoroutinefunction(func):
-                        return await func(*args, **kwargs)
-                    else:
-                        from fastapi.concurrency import run_in_threadpool as run_in_pool
+                if strip_websocket:
+                    kwargs.pop("websocket", None)
 
-                        return await run_in_pool(func, *args, **kwargs)
+            return await call_endpoint(*args, **kwargs)
 
-            if req and res:
-                from .dependencies import DeprecationSunset
+        # We need to create a wrapper that accepts request/response if needed
+        # But we also need to expose them to FastAPI so it injects them.
+        async def http_wrapper(*args, **kwargs):
+            req: Request = kwargs.get("request")
+            res: Response = kwargs.get("response")
 
+            if req and res:
                 try:
                     await dep(req, res)
                 except DeprecationSunset as e:
                     block_res = e.response
-                    if getattr(block_res, "media_type", None) == "text/event-stream":
-                        from starlette.responses import StreamingResponse
-
-                        if isinstance(block_res, StreamingResponse):
-                            from .sse import deprecated_sse_generator
-
-                            block_res.body_iterator = deprecated_sse_generator(
-                                block_res.body_iterator, dep.config
-                            )
+                    wrap_sse(block_res)
                     return block_res
 
-            # Prepare kwargs for func
-            func_kwargs = kwargs.copy()
-
             # If func did NOT ask for request/response and doesn't accept **kwargs,
-            # we must remove them to avoid TypeError.
-            if not has_varkw:
-                if not has_request:
-                    func_kwargs.pop("request", None)
-                if not has_response:
-                    func_kwargs.pop("response", None)
-
-            if inspect.iscoroutinefunction(func):
-                ret_val = await func(*args, **func_kwargs)
-            else:
-                ret_val = await run_in_threadpool(func, *args, **func_kwargs)
-
-            # If the user returns a Response directly (like StreamingResponse), FastAPI
-            # often ignores headers attached to the injected `res` object. We must manually merge them.
-            if isinstance(ret_val, Response) and res:
-                for k, v in res.headers.items():
-                    ret_val.headers.setdefault(k, v)
+            # we must remove them to avoid TypeError. `**kwargs` is always a fresh
+            # dict owned by this call, so it is safe to pop in place.
+            for k in strip_keys:
+                kwargs.pop(k, None)
 
-            # Auto-wrap SSE streams
-            if (
-                isinstance(ret_val, Response)
-                and getattr(ret_val, "media_type", None) == "text/event-stream"
-            ):
-                from starlette.responses import StreamingResponse
+            ret_val = await call_endpoint(*args, **kwargs)
 
-                if isinstance(ret_val, StreamingResponse):
-                    from .sse import deprecated_sse_generator
+            if isinstance(ret_val, Response):
+                # If the user returns a Response directly (like StreamingResponse), FastAPI
+                # often ignores headers attached to the injected `res` object. We must manually merge them.
+                if res:
+                    for k, v in res.headers.items():
+                        ret_val.headers.setdefault(k, v)
 
-                    ret_val.body_iterator = deprecated_sse_generator(
-                        ret_val.body_iterator, dep.config
-                    )
+                wrap_sse(ret_val)
 
             return ret_val
 
+        # Copy only the metadata FastAPI reads; the signature is set explicitly below
+        wrapper = websocket_wrapper if is_websocket else http_wrapper
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__module__ = func.__module__
+        # Keep attributes set by other decorators, as functools.wraps does
+        wrapper.__dict__.update(func.__dict__)
+        if resolved:
+            wrapper.__dict__.pop("__wrapped__", None)
+        else:
+            wrapper.__wrapped__ = func
+
         # Update wrapper signature
         new_params = list(params)  # Start with original params
 
         args_to_add = []
-        if not has_request and not any(p.annotation == WebSocket for p in params):
+        if not has_request and not is_websocket:
             args_to_add.append(
                 inspect.Parameter(
                     "request",
@@ -172,7 +189,7 @@ def deprecated(
                     annotation=Request,
                 )
             )
-        if not has_response and not any(p.annotation == WebSocket for p in params):
+        if not has_response and not is_websocket:
             args_to_add.append(
                 inspect.Parameter(
                     "response",
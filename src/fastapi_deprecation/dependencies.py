@@ -1,4 +1,5 @@
-from datetime import datetime, timezone
+import functools
+from operator import attrgetter
 from typing import Callable, Optional
 
 from fastapi import HTTPException, Request, Response, status
@@ -7,9 +8,11 @@ from starlette.responses import Response as StarletteResponse
 from .engine import (
     ActionType,
     DeprecationConfig,
-    apply_headers,
+    apply_raw_headers,
     build_block_response,
+    copy_response,
     execute_telemetry,
+    get_block_detail,
     process_deprecation,
 )
 from .utils import DateInput, parse_date
@@ -24,6 +27,10 @@ async def sunset_exception_handler(request: Request, exc: DeprecationSunset):
     return exc.response
 
 
+def _config_property(name: str) -> property:
+    return property(attrgetter(f"config.{name}"))
+
+
 class DeprecationDependency:
     """
     A dependency that can be used to deprecate an endpoint or router.
@@ -41,8 +48,27 @@ class DeprecationDependency:
         cache_tag (Optional[str]): Cache tag for the deprecation.
         brownout_probability (float): Probability of a brownout.
         progressive_brownout (bool): Whether to use progressive brownout.
+        skip_methods (frozenset[str]): HTTP methods passed through untouched, e.g. CORS preflights.
     """
 
+    __slots__ = ("config",)
+
+    # Read-only proxies to the internal DeprecationConfig for backwards compatibility
+    deprecation_date = _config_property("deprecation_date")
+    sunset_date = _config_property("sunset_date")
+    brownouts = _config_property("brownouts")
+    alternative = _config_property("alternative")
+    alternative_status = _config_property("alternative_status")
+    link = _config_property("link")
+    links = _config_property("links")
+    detail = _config_property("detail")
+    custom_response = _config_property("custom_response")
+    inject_cache_control = _config_property("inject_cache_control")
+    cache_tag = _config_property("cache_tag")
+    brownout_probability = _config_property("brownout_probability")
+    progressive_brownout = _config_property("progressive_brownout")
+    skip_methods = _config_property("skip_methods")
+
     def __init__(
         self,
         deprecation_date: Optional[DateInput] = None,
@@ -58,6 +84,7 @@ class DeprecationDependency:
         cache_tag: Optional[str] = None,
         brownout_probability: float = 0.0,
         progressive_brownout: bool = False,
+        skip_methods: frozenset[str] = frozenset({"OPTIONS"}),
     ):
         dep_date = parse_date(deprecation_date) if deprecation_date else None
         sun_date = parse_date(sunset_date) if sunset_date else None
@@ -81,40 +108,76 @@ class DeprecationDependency:
             cache_tag=cache_tag,
             brownout_probability=brownout_probability,
             progressive_brownout=progressive_brownout,
+            skip_methods=frozenset(skip_methods),
         )
 
-    def __getattr__(self, item):
-        """Pass through attribute accesses to the internal DeprecationConfig for backwards compatibility."""
-        return getattr(self.config, item)
+    @classmethod
+    def get(cls, **kwargs) -> "DeprecationDependency":
+        """
+        Return a shared instance for identical arguments.
+
+        Useful when many routers carry the same deprecation schedule: dates are parsed
+        and headers precomputed once, and all routes share a single config.
+        Falls back to a fresh instance when an argument is not hashable.
+        """
+        frozen = dict(kwargs)
+        if frozen.get("links"):
+            frozen["links"] = tuple(frozen["links"].items())
+        if frozen.get("brownouts"):
+            frozen["brownouts"] = tuple(tuple(b) for b in frozen["brownouts"])
+
+        try:
+            return _get_shared_dependency(cls, tuple(sorted(frozen.items())))
+        except TypeError:
+            return cls(**kwargs)
 
     async def __call__(self, request: Request, response: Response):
-        now = datetime.now(timezone.utc)
-        result = process_deprecation(self.config, now)
+        if request.method in self.config.skip_methods:
+            return
+
+        result = process_deprecation(self.config)
 
         if result.action == ActionType.BLOCK:
             dummy_res = build_block_response(self.config, result)
             await execute_telemetry(request, dummy_res, self)
 
             if self.config.custom_response:
+                if dummy_res is self.config._block_response:
+                    # Sent via Response.__call__, which hands its own header list to
+                    # outer middleware: give every request a list of its own
+                    dummy_res = copy_response(dummy_res)
                 raise DeprecationSunset(dummy_res)
 
+            # A copy: exception handlers may edit `exc.headers`
+            headers = dict(result.headers)
             if self.config.alternative:
-                headers = dict(result.headers)
                 headers["Location"] = self.config.alternative
-                raise HTTPException(
-                    status_code=self.config.alternative_status,
-                    detail=self.config.detail or "Endpoint is deprecated and replaced.",
-                    headers=headers,
-                )
+                status_code = self.config.alternative_status
             else:
-                raise HTTPException(
-                    status_code=status.HTTP_410_GONE,
-                    detail=self.config.detail
-                    or "Endpoint is deprecated and no longer available.",
-                    headers=result.headers,
-                )
-
-        # WARN Phase
-        apply_headers(response.headers, result.headers)
+                status_code = status.HTTP_410_GONE
+
+            raise HTTPException(
+                status_code=status_code,
+                detail=get_block_detail(self.config),
+                headers=headers,
+            )
+
+        # WARN Phase: write the pre-encoded pairs straight into the raw header list.
+        # Updated in place since `response.headers` may already be a view over it.
+        response.raw_headers[:] = apply_raw_headers(
+            response.raw_headers, result.raw_headers
+        )
 
         await execute_telemetry(request, response, self)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_shared_dependency(
+    cls: type[DeprecationDependency], frozen_kwargs: tuple
+) -> DeprecationDependency:
+    kwargs = dict(frozen_kwargs)
+    if kwargs.get("links"):
+        kwargs["links"] = dict(kwargs["links"])
+    if kwargs.get("brownouts"):
+        kwargs["brownouts"] = list(kwargs["brownouts"])
+    return cls(**kwargs)
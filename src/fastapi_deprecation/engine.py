@@ -1,26 +1,158 @@
+import asyncio
+import copy
 import inspect
+import json
 import logging
+import random
+import time
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from fastapi import Request, Response, status
+from starlette.datastructures import Headers
 from starlette.responses import Response as StarletteResponse
 
-from .utils import format_deprecation_date, format_sunset_date
+from .utils import (
+    _format_deprecation_from_ts,
+    format_deprecation_date,
+    format_sunset_date,
+)
 
 # Global callbacks for telemetry
 _DEPRECATION_CALLBACKS: Optional[List[Callable[[Request, Response, Any], None]]] = []
 
 
-def set_deprecation_callback(callback: Callable[[Request, Response, Any], None]):
-    """Set a global callback for telemetry."""
+class _BackgroundCallback:
+    """
+    Runs a telemetry callback off the request path.
+
+    Events are pushed onto a bounded queue and drained in batches by a single task
+    bound to the running event loop. Events are dropped when the queue is full.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Request, Response, Any], None],
+        maxsize: int = 1024,
+        batch_size: int = 64,
+    ):
+        self.callback = callback
+        self.__name__ = getattr(callback, "__name__", repr(callback))
+        self._maxsize = maxsize
+        self._batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __call__(self, request: Request, response: Response, dep: Any) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._queue = asyncio.Queue(self._maxsize)
+            self._task = loop.create_task(self._drain(self._queue))
+
+        try:
+            self._queue.put_nowait((request, response, dep))
+        except asyncio.QueueFull:
+            pass
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for event in batch:
+                try:
+                    # Checked on the result, as objects with an async __call__ are
+                    # not coroutine functions
+                    result = self.callback(*event)
+                    if inspect.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    logging.getLogger("fastapi_deprecation").error(
+                        f"Telemetry callback failed on call to <{self.__name__}>: {e}"
+                    )
+                finally:
+                    queue.task_done()
+
+    async def aclose(self) -> None:
+        """Process the queued events, then stop the drain task."""
+        task, self._task = self._task, None
+        # A task bound to another (closed) loop can no longer be awaited or cancelled
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            return
+        await self._queue.join()
+        task.cancel()
+
+
+class _TelemetryResponse:
+    """
+    Response stand-in handed to telemetry callbacks by the middleware.
+
+    The middleware streams the real response straight through, so only its status
+    and headers are known. This exposes them with the same attribute names as a
+    Starlette Response without building one per request.
+    """
+
+    __slots__ = ("status_code", "raw_headers")
+
+    def __init__(
+        self, status_code: int, raw_headers: Optional[List[Tuple[bytes, bytes]]] = None
+    ):
+        self.status_code = status_code
+        self.raw_headers = raw_headers if raw_headers is not None else []
+
+    @property
+    def headers(self) -> Headers:
+        return Headers(raw=self.raw_headers)
+
+
+def set_deprecation_callback(
+    callback: Callable[[Request, Response, Any], None], background: bool = False
+):
+    """
+    Set a global callback for telemetry.
+
+    Args:
+        callback: Called with the request, the response and the deprecation config or dependency.
+        background (bool): Queue the events and run the callback from a background task
+            instead of awaiting it on the request path. Events are dropped under overload.
+    """
     global _DEPRECATION_CALLBACKS
     if callback:
+        if background:
+            callback = _BackgroundCallback(callback)
         _DEPRECATION_CALLBACKS.append(callback)
 
 
+async def flush_deprecation_callbacks() -> None:
+    """
+    Process the events still queued for background callbacks and stop their tasks.
+
+    Call it on application shutdown, otherwise queued telemetry is dropped.
+    """
+    for callback in _DEPRECATION_CALLBACKS:
+        if isinstance(callback, _BackgroundCallback):
+            await callback.aclose()
+
+
 def get_deprecation_callbacks() -> (
     Optional[List[Callable[[Request, Response, Any], None]]]
 ):
@@ -31,17 +163,19 @@ async def execute_telemetry(
     request: Request, response: Response, dep_config_or_dependency: Any
 ):
     """Safely execute the registered telemetry callback if one exists."""
-    callbacks = get_deprecation_callbacks()
+    callbacks = _DEPRECATION_CALLBACKS
     if callbacks:
         try:
             for callback in callbacks:
-                if inspect.iscoroutinefunction(callback):
-                    await callback(request, response, dep_config_or_dependency)
-                else:
-                    callback(request, response, dep_config_or_dependency)
+                # Await only what comes back as a coroutine: a type check on the
+                # result instead of introspecting the callback on every request
+                result = callback(request, response, dep_config_or_dependency)
+                if inspect.iscoroutine(result):
+                    await result
         except Exception as e:
+            name = getattr(callback, "__name__", repr(callback))
             logging.getLogger("fastapi_deprecation").error(
-                f"Telemetry callback failed on call to <{callback.__name__}>: {e}"
+                f"Telemetry callback failed on call to <{name}>: {e}"
             )
 
 
@@ -50,7 +184,7 @@ class ActionType(Enum):
     BLOCK = "BLOCK"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeprecationConfig:
     """
     Configuration for deprecation.
@@ -68,6 +202,7 @@ class DeprecationConfig:
         cache_tag (Optional[str]): Cache tag for the deprecation.
         brownout_probability (float): Probability of a brownout.
         progressive_brownout (bool): Whether to use progressive brownout.
+        skip_methods (FrozenSet[str]): HTTP methods passed through without deprecation handling.
     """
 
     deprecation_date: Optional[datetime] = None
@@ -85,6 +220,50 @@ class DeprecationConfig:
     cache_tag: Optional[str] = None
     brownout_probability: float = 0.0
     progressive_brownout: bool = False
+    skip_methods: FrozenSet[str] = frozenset({"OPTIONS"})
+
+    # Precomputed at construction, the dates are static for the config lifetime
+    _deprecation_header: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Headers that never change for the (warning, sunset) phases
+    _static_headers: Tuple[Dict[str, str], Dict[str, str]] = field(
+        default_factory=lambda: ({}, {}), init=False, repr=False, compare=False
+    )
+    # The same headers as latin-1 encoded ASGI pairs
+    _static_raw_headers: Tuple[
+        List[Tuple[bytes, bytes]], List[Tuple[bytes, bytes]]
+    ] = field(default_factory=lambda: ([], []), init=False, repr=False, compare=False)
+    # POSIX timestamps so the request path compares floats instead of datetimes
+    _deprecation_ts: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sunset_ts: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Seconds from deprecation to sunset, the progressive brownout denominator
+    _lifecycle_span: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Brownout window starts (sorted) and the running maximum of their ends
+    _brownout_starts: List[float] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _brownout_ends: List[float] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Serialized body of the default block response (JSON 410 or plain-text redirect)
+    _block_body: bytes = field(default=b"", init=False, repr=False, compare=False)
+    # Content and redirect headers sent with `_block_body`
+    _block_headers: List[Tuple[bytes, bytes]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Copy of a `custom_response` instance carrying this config's block headers
+    _block_response: Optional[StarletteResponse] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (second bucket, scheduled sunset, {is_sunset: DeprecationResult})
+    _cache: Optional[Tuple[int, bool, Dict[bool, "DeprecationResult"]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if (
@@ -109,95 +288,237 @@ class DeprecationConfig:
         if not (0.0 <= self.brownout_probability <= 1.0):
             raise ValueError("brownout_probability must be between 0.0 and 1.0")
 
+        if self.deprecation_date:
+            self._deprecation_header = format_deprecation_date(self.deprecation_date)
+            self._deprecation_ts = self.deprecation_date.timestamp()
+        if self.sunset_date:
+            self._sunset_ts = self.sunset_date.timestamp()
+            if self._deprecation_ts is not None:
+                self._lifecycle_span = self._sunset_ts - self._deprecation_ts
+        self._index_brownouts()
+        self._static_headers = (
+            self._build_static_headers("deprecation"),
+            self._build_static_headers("sunset"),
+        )
+        self._static_raw_headers = (
+            encode_headers(self._static_headers[False]),
+            encode_headers(self._static_headers[True]),
+        )
+
+        detail = get_block_detail(self)
+        if not self.alternative:
+            # Same encoding as JSONResponse.render(), done once instead of per block
+            detail = json.dumps(
+                {"detail": detail},
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+            )
+        self._block_body = detail.encode("utf-8")
+        content_type = b"application/json"
+        if self.alternative:
+            content_type = b"text/plain; charset=utf-8"
+        self._block_headers = [
+            (b"content-length", str(len(self._block_body)).encode("latin-1")),
+            (b"content-type", content_type),
+        ]
+        if self.alternative:
+            self._block_headers.append(
+                (b"location", self.alternative.encode("latin-1"))
+            )
 
-@dataclass
+        if isinstance(self.custom_response, StarletteResponse):
+            # A response instance is shared by every blocked request, so its block
+            # headers are static and applied exactly once instead of on every hit.
+            # They go on a copy: the caller's instance may serve several schedules.
+            block_headers = _build_result(self, time.time(), True).raw_headers
+            response = copy_response(self.custom_response)
+            response.raw_headers = apply_raw_headers(
+                response.raw_headers, block_headers
+            )
+            self._block_response = response
+
+    def _index_brownouts(self) -> None:
+        # Windows may overlap, so each slot keeps the furthest end seen so far:
+        # a single bisect on the starts then answers "is any window active".
+        starts: List[float] = []
+        ends: List[float] = []
+        furthest_end = float("-inf")
+        windows = sorted((s.timestamp(), e.timestamp()) for s, e in self.brownouts)
+        for start, end in windows:
+            furthest_end = max(furthest_end, end)
+            starts.append(start)
+            ends.append(furthest_end)
+        self._brownout_starts = starts
+        self._brownout_ends = ends
+
+    def _build_static_headers(self, link_rel: str) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+
+        if self._deprecation_header:
+            headers["Deprecation"] = self._deprecation_header
+
+        links = self.links and self.links.copy() or {}
+        if self.link:
+            links[link_rel] = self.link
+        if links:
+            headers["Link"] = ", ".join(
+                f'<{url}>; rel="{rel}"' for rel, url in links.items()
+            )
+
+        if self.sunset_date:
+            headers["Sunset"] = format_sunset_date(self.sunset_date)
+
+        if self.cache_tag:
+            headers["Cache-Tag"] = self.cache_tag
+            headers["Surrogate-Key"] = self.cache_tag
+
+        return headers
+
+
+@dataclass(slots=True)
 class DeprecationResult:
+    # Results are cached and shared by every request within the same second,
+    # so the headers are exposed read-only: copy them before editing
     action: ActionType
-    headers: Dict[str, str]
+    headers: Mapping[str, str]
+    # Pre-encoded ASGI pairs of `headers`, built once per cached result
+    raw_headers: Tuple[Tuple[bytes, bytes], ...] = ()
+
+
+def _is_scheduled_sunset(config: DeprecationConfig, now_ts: float) -> bool:
+    """Deterministic part of the evaluation: sunset date and scheduled brownouts."""
+    sunset_ts = config._sunset_ts
+    if sunset_ts is not None and now_ts >= sunset_ts:
+        return True
+
+    idx = bisect_right(config._brownout_starts, now_ts) - 1
+    return idx >= 0 and now_ts <= config._brownout_ends[idx]
+
+
+def _is_chaos_brownout(config: DeprecationConfig, now_ts: float) -> bool:
+    """Chaos Engineering: Probabilistic Brownouts, rolled on every evaluation."""
+    if config.progressive_brownout:
+        # Progressive: failure probability scales from 0.0 at deprecation_date to 1.0 at sunset_date
+        # (Validation ensures deprecation_date and sunset_date are present)
+        elapsed_duration = now_ts - config._deprecation_ts
+        if elapsed_duration >= 0 and config._lifecycle_span > 0:
+            probability = elapsed_duration / config._lifecycle_span
+            return random.random() < probability
+    elif config.brownout_probability > 0:
+        # Static: uniform failure chance during the whole deprecation window
+        return random.random() < config.brownout_probability
+
+    return False
+
+
+def _build_result(
+    config: DeprecationConfig, now_ts: float, is_sunset: bool
+) -> DeprecationResult:
+    static_headers = config._static_headers[is_sunset]
+    raw_headers = list(config._static_raw_headers[is_sunset])
+
+    # Only the request-time Deprecation date and Cache-Control vary per evaluation,
+    # so those are the only values formatted and encoded here
+    if config._deprecation_header:
+        headers = static_headers.copy()
+    else:
+        deprecation = _format_deprecation_from_ts(now_ts)
+        headers = {"Deprecation": deprecation, **static_headers}
+        raw_headers.insert(0, (b"deprecation", deprecation.encode("latin-1")))
+
+    if config.inject_cache_control and config.sunset_date and not is_sunset:
+        seconds = int(config._sunset_ts - now_ts)
+        if seconds > 0:
+            headers["Cache-Control"] = f"max-age={seconds}"
+            raw_headers.append((b"cache-control", b"max-age=%d" % seconds))
+
+    action = ActionType.BLOCK if is_sunset else ActionType.WARN
+    return DeprecationResult(
+        action=action,
+        headers=MappingProxyType(headers),
+        raw_headers=tuple(raw_headers),
+    )
 
 
 def process_deprecation(
     config: DeprecationConfig, request_time: Optional[datetime] = None
 ) -> DeprecationResult:
-    import random
-
-    now = request_time or datetime.now(timezone.utc)
-    headers: Dict[str, str] = {}
-
-    is_sunset = False
-    if config.sunset_date and now >= config.sunset_date:
-        is_sunset = True
-
-    if not is_sunset and config.brownouts:
-        for start, end in config.brownouts:
-            if start <= now <= end:
-                is_sunset = True
-                break
-
-    # Chaos Engineering: Probabilistic Brownouts
-    if not is_sunset:
-        if config.progressive_brownout:
-            # Progressive: failure probability scales from 0.0 at deprecation_date to 1.0 at sunset_date
-            # (Validation ensures deprecation_date and sunset_date are present)
-            if now >= config.deprecation_date:
-                total_duration = (
-                    config.sunset_date - config.deprecation_date
-                ).total_seconds()
-                elapsed_duration = (now - config.deprecation_date).total_seconds()
-
-                if total_duration > 0:
-                    probability = elapsed_duration / total_duration
-                    if random.random() < probability:
-                        is_sunset = True
-        elif config.brownout_probability > 0:
-            # Static: uniform failure chance during the whole deprecation window
-            if random.random() < config.brownout_probability:
-                is_sunset = True
-
-    dt_to_emit = config.deprecation_date if config.deprecation_date else now
-    headers["Deprecation"] = format_deprecation_date(dt_to_emit)
-
-    links = config.links and config.links.copy() or {}
-
-    if config.link:
-        if is_sunset:
-            links["sunset"] = config.link
-        else:
-            links["deprecation"] = config.link
+    """
+    Evaluate the deprecation lifecycle of a config at the given time.
 
-    if links:
-        response_links = [f'<{url}>; rel="{rel}"' for rel, url in links.items()]
-        headers["Link"] = ", ".join(response_links)
+    Everything except the probabilistic brownout roll only changes once per second,
+    so the scheduled phase and the built results are cached per wall-clock second.
+    """
+    now_ts = time.time() if request_time is None else request_time.timestamp()
+    bucket = int(now_ts)
 
-    if config.sunset_date:
-        headers["Sunset"] = format_sunset_date(config.sunset_date)
+    cache = config._cache
+    if cache is None or cache[0] != bucket:
+        cache = config._cache = (bucket, _is_scheduled_sunset(config, now_ts), {})
 
-        if config.inject_cache_control and not is_sunset:
-            delta = config.sunset_date - now
-            seconds = int(delta.total_seconds())
-            if seconds > 0:
-                headers["Cache-Control"] = f"max-age={seconds}"
+    # Only roll when chaos is enabled; read live since the probability may be tuned at runtime
+    is_sunset = cache[1] or (
+        (config.brownout_probability > 0 or config.progressive_brownout)
+        and _is_chaos_brownout(config, now_ts)
+    )
 
-    if config.cache_tag:
-        headers["Cache-Tag"] = config.cache_tag
-        headers["Surrogate-Key"] = config.cache_tag
+    results = cache[2]
+    result = results.get(is_sunset)
+    if result is None:
+        result = results[is_sunset] = _build_result(config, now_ts, is_sunset)
+    return result
 
-    if is_sunset:
-        return DeprecationResult(action=ActionType.BLOCK, headers=headers)
-    else:
-        return DeprecationResult(action=ActionType.WARN, headers=headers)
+
+# Headers whose values are appended to an existing value rather than replacing it
+_MERGEABLE_HEADERS = (b"link", b"cache-control")
+
+
+def encode_headers(headers: Dict[str, str]) -> List[Tuple[bytes, bytes]]:
+    """Encode DeprecationResult headers into ASGI raw header pairs."""
+    return [
+        (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()
+    ]
+
+
+def apply_raw_headers(
+    raw_headers: List[Tuple[bytes, bytes]], pairs: Sequence[Tuple[bytes, bytes]]
+) -> List[Tuple[bytes, bytes]]:
+    """
+    Merge pre-encoded header pairs into an ASGI raw header list.
+    Mirrors `apply_headers` semantics without a MutableHeaders round-trip.
+    """
+    if not raw_headers:
+        # e.g. the header-less sub-response FastAPI injects into dependencies
+        return list(pairs)
+
+    present = {key for key, _ in raw_headers}
+    if present.isdisjoint([key for key, _ in pairs]):
+        # Common case: the app set none of our headers, nothing to merge or replace
+        return [*raw_headers, *pairs]
+
+    headers = list(raw_headers)
+    for key, value in pairs:
+        if key in present:
+            existing = next(v for k, v in headers if k == key)
+            headers = [(k, v) for k, v in headers if k != key]
+            if key in _MERGEABLE_HEADERS:
+                value = existing + b", " + value
+        headers.append((key, value))
+    return headers
 
 
 def apply_headers(target, headers: Dict[str, str]) -> None:
     """Safely apply DeprecationResult headers to a MutableHeaders or dict-like object."""
+    # Use get() for MutableHeaders/dicts, resolved once rather than per header
+    getter = getattr(target, "get", None)
     for k, v in headers.items():
         if k in ("Link", "Cache-Control"):
-            # Use get() for MutableHeaders, or direct access for dicts if safe
-            existing = (
-                target.get(k)
-                if hasattr(target, "get")
-                else (target[k] if k in target else None)
-            )
+            if getter is not None:
+                existing = getter(k)
+            else:
+                existing = target[k] if k in target else None
             if existing:
                 target[k] = f"{existing}, {v}"
             else:
@@ -206,57 +527,122 @@ def apply_headers(target, headers: Dict[str, str]) -> None:
             target[k] = v
 
 
+def get_block_detail(config: DeprecationConfig) -> str:
+    """Returns the message sent to clients of a blocked endpoint."""
+    if config.detail:
+        return config.detail
+    if config.alternative:
+        return "Endpoint is deprecated and replaced."
+    return "Endpoint is deprecated and no longer available."
+
+
+def copy_response(response: StarletteResponse) -> StarletteResponse:
+    """Shallow copy of `response` owning its own raw header list."""
+    response = copy.copy(response)
+    # Drop any `headers` view cached over the original's list
+    vars(response).pop("_headers", None)
+    response.raw_headers = list(response.raw_headers)
+    return response
+
+
 def build_block_response(
     config: DeprecationConfig, result: DeprecationResult
 ) -> StarletteResponse:
     """Constructs an overriding Starlette Response for blocking actions with the specified status code."""
-    from starlette.responses import JSONResponse, PlainTextResponse
-
     if config.custom_response:
         if isinstance(config.custom_response, StarletteResponse):
-            response = config.custom_response
-        else:
-            response = config.custom_response()
+            # Block headers were applied at config construction, only a
+            # request-time Deprecation date still has to be refreshed
+            response = config._block_response
+            if config._deprecation_header is None:
+                response.headers["Deprecation"] = result.headers["Deprecation"]
+            return response
+
+        response = config.custom_response()
     elif config.alternative:
-        response = PlainTextResponse(
-            content=config.detail or "Endpoint is deprecated and replaced.",
+        response = Response(
+            content=config._block_body,
             status_code=config.alternative_status,
+            media_type="text/plain",
         )
-        response.headers["Location"] = config.alternative
+        # Pre-encoded Location pair, the last of the block headers for redirects
+        response.raw_headers.append(config._block_headers[-1])
     else:
-        response = JSONResponse(
-            content={
-                "detail": config.detail
-                or "Endpoint is deprecated and no longer available."
-            },
+        response = Response(
+            content=config._block_body,
             status_code=status.HTTP_410_GONE,
+            media_type="application/json",
         )
 
-    apply_headers(response.headers, result.headers)
+    # Merge the pre-encoded pairs in place, `response.headers` is a view over this list
+    response.raw_headers[:] = apply_raw_headers(
+        response.raw_headers, result.raw_headers
+    )
     return response
 
 
+def build_block_start_message(
+    config: DeprecationConfig, result: DeprecationResult
+) -> Dict[str, Any]:
+    """
+    Raw ASGI `http.response.start` message of the default block response.
+    Sent together with `config._block_body`; not applicable to custom responses.
+    """
+    return {
+        "type": "http.response.start",
+        "status": (
+            config.alternative_status if config.alternative else status.HTTP_410_GONE
+        ),
+        "headers": [*config._block_headers, *result.raw_headers],
+    }
+
+
+def is_shared_response(config: DeprecationConfig, response: StarletteResponse) -> bool:
+    """Whether `response` is the config's reusable, fully rendered custom response."""
+    return (
+        response is config._block_response
+        and type(response).__call__ is StarletteResponse.__call__
+    )
+
+
+async def send_shared_response(response: StarletteResponse, send: Callable) -> None:
+    """
+    Sends a rendered response instance that is reused across requests.
+
+    Equivalent to `Response.__call__`, except that the header list is copied: outer
+    middleware may edit `message["headers"]` in place, which would otherwise leak
+    into every later response.
+    """
+    await send(
+        {
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": list(response.raw_headers),
+        }
+    )
+    await send({"type": "http.response.body", "body": response.body})
+
+    if response.background is not None:
+        await response.background()
+
+
 async def send_websocket_block_response(
     config: DeprecationConfig, result: DeprecationResult, send: Callable
 ) -> None:
     """Sends a raw ASGI HTTP response directly rejecting the WebSocket upgrade."""
-    content = config.detail or "Endpoint is deprecated and no longer available."
-    status_code = status.HTTP_410_GONE
-
     if config.alternative:
-        content = config.detail or "Endpoint is deprecated and replaced."
+        # Redirects already carry a plain-text body and Location, built once per config
         status_code = config.alternative_status
-
-    headers = [
-        (b"content-type", b"text/plain; charset=utf-8"),
-        (b"content-length", str(len(content)).encode("utf-8")),
-    ]
-
-    if config.alternative:
-        headers.append((b"location", config.alternative.encode("utf-8")))
-
-    for k, v in result.headers.items():
-        headers.append((k.lower().encode("utf-8"), v.encode("utf-8")))
+        body = config._block_body
+        headers = [*config._block_headers, *result.raw_headers]
+    else:
+        status_code = status.HTTP_410_GONE
+        body = get_block_detail(config).encode("utf-8")
+        headers = [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(body)).encode("utf-8")),
+            *result.raw_headers,
+        ]
 
     await send(
         {
@@ -268,6 +654,6 @@ async def send_websocket_block_response(
     await send(
         {
             "type": "http.response.body",
-            "body": content.encode("utf-8"),
+            "body": body,
         }
     )
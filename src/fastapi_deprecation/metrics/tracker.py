@@ -80,10 +80,9 @@ class DeprecationTracker:
 
         # Dispatch to the active storage plugin
         try:
-            if inspect.iscoroutinefunction(self.store.increment):
-                await self.store.increment(path, method, phase, config)
-            else:
-                self.store.increment(path, method, phase, config)  # type: ignore
+            res = self.store.increment(path, method, phase, config)
+            if inspect.iscoroutine(res):
+                await res
         except Exception:
             # We must never crash the user's application because metrics failed
             # Logging could be added here in the future
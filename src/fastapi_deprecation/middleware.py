@@ -1,26 +1,86 @@
-from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from fastapi import Request, Response
-from starlette.datastructures import MutableHeaders
+from fastapi import Request
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .dependencies import DeprecationDependency
 from .engine import (
     ActionType,
     DeprecationConfig,
-    apply_headers,
+    _TelemetryResponse,
+    apply_raw_headers,
     build_block_response,
+    build_block_start_message,
     execute_telemetry,
+    get_deprecation_callbacks,
+    is_shared_response,
     process_deprecation,
+    send_shared_response,
     send_websocket_block_response,
 )
 
 
+PrefixIndex = Tuple[Dict[str, Any], Tuple[int, ...]]
+
+
+def build_prefix_index(entries: Dict[str, Any]) -> PrefixIndex:
+    """
+    Index path prefixes for longest-prefix lookup.
+
+    Returns the prefix table and its distinct prefix lengths, longest first, so a
+    lookup costs one path slice and dict probe per distinct length instead of a
+    startswith() test per registered prefix.
+    """
+    return dict(entries), tuple(sorted({len(p) for p in entries}, reverse=True))
+
+
+def match_prefix(index: PrefixIndex, path: str) -> Optional[Any]:
+    """Returns the value registered for the longest prefix of `path`, if any."""
+    table, lengths = index
+    for length in lengths:
+        match = table.get(path[:length])
+        if match is not None:
+            return match
+    return None
+
+
+class _SendWrapper:
+    """
+    ASGI `send` wrapper injecting the deprecation headers into the response start
+    (or websocket accept) message, capturing the status and headers for telemetry.
+    """
+
+    __slots__ = ("send", "header_pairs", "status", "headers")
+
+    def __init__(self, send: Send, header_pairs: Sequence[Tuple[bytes, bytes]]):
+        self.send = send
+        self.header_pairs = header_pairs
+        self.status = 200
+        self.headers: List[Tuple[bytes, bytes]] = []
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            self.headers = apply_raw_headers(
+                message.get("headers", []), self.header_pairs
+            )
+            message["headers"] = self.headers
+        elif message["type"] == "websocket.accept":
+            # Inject headers into websocket accept response
+            message["headers"] = apply_raw_headers(
+                message.get("headers", []), self.header_pairs
+            )
+
+        await self.send(message)
+
+
 class DeprecationMiddleware:
     """
-    Middleware to handle deprecation headers and blocking for entire path prefixes.
+    Pure ASGI middleware to handle deprecation headers and blocking for entire path prefixes.
     Intercepts 404s and 200s to inject RFC 9745 context.
+
+    Headers are appended to the raw `http.response.start` message, so no Request/Response
+    objects are built on the hot path unless a telemetry callback is registered.
     """
 
     def __init__(
@@ -31,113 +91,106 @@ class DeprecationMiddleware:
         self.app = app
         self.original_deprecations = deprecations
 
-        normalized_deps = {}
-        for prefix, dep in deprecations.items():
-            if hasattr(dep, "config"):
-                normalized_deps[prefix] = dep.config
-            else:
-                normalized_deps[prefix] = dep
+        normalized_deps = {
+            prefix: dep.config if isinstance(dep, DeprecationDependency) else dep
+            for prefix, dep in deprecations.items()
+        }
 
         # Sort prefixes by length descending to match most specific first
         self.deprecations = dict(
             sorted(normalized_deps.items(), key=lambda item: len(item[0]), reverse=True)
         )
 
+        self._prefix_table, self._prefix_lengths = build_prefix_index(
+            {
+                prefix: (config, deprecations[prefix])
+                for prefix, config in self.deprecations.items()
+            }
+        )
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] not in ("http", "websocket"):
             await self.app(scope, receive, send)
             return
 
-        # Request object constructor requires HTTP scope. For URL path extraction, we can
-        # either use a dummy HTTP scope or just extract path manually.
-        if scope["type"] == "websocket":
-            # For websockets, we can still parse the URL path safely from scope
-            path = scope.get("path", "")
-            # Create a dummy HTTP scope to allow Request() to parsing,
-            # purely so `execute_telemetry` doesn't break if it expects a Request object.
-            # However, execute_telemetry isn't strictly necessary to send WebSockets
-            # so we'll just parse the path here.
-            from starlette.websockets import WebSocket
-
-            request = WebSocket(scope, receive, send)
-        else:
-            request = Request(scope, receive)
-            path = request.url.path
-
-        # Find matching deprecation
-        matched_config: Optional[DeprecationConfig] = None
-        matched_prefix: Optional[str] = None
-        for prefix, config in self.deprecations.items():
-            if path.startswith(prefix):
-                matched_config = config
-                matched_prefix = prefix
-                break
+        path = scope.get("path", "")
 
-        if not matched_config:
+        # Find matching deprecation, bailing out untouched for unrelated paths.
+        # Same lookup as match_prefix(), inlined on the per-request path.
+        prefix_table = self._prefix_table
+        for length in self._prefix_lengths:
+            match = prefix_table.get(path[:length])
+            if match is not None:
+                break
+        else:
             await self.app(scope, receive, send)
             return
 
-        now = datetime.now(timezone.utc)
-        result = process_deprecation(matched_config, now)
+        matched_config, original_dep = match
+
+        if scope.get("method") in matched_config.skip_methods:
+            await self.app(scope, receive, send)
+            return
 
-        # original dependency for callback if provided
-        original_dep = self.original_deprecations[matched_prefix]
+        result = process_deprecation(matched_config)
 
         if result.action == ActionType.BLOCK:
             if scope["type"] == "websocket":
                 # For websockets, we must send raw ASGI HTTP response to deny upgrade
                 await send_websocket_block_response(matched_config, result, send)
-                # Reconstruct dummy response for telemetry
-                dummy_res = Response(status_code=410)
-                await execute_telemetry(request, dummy_res, original_dep)
+                if get_deprecation_callbacks():
+                    from starlette.websockets import WebSocket
+
+                    # Reconstruct dummy response for telemetry, with a header list of
+                    # its own: the result is cached and shared with later requests
+                    dummy_res = _TelemetryResponse(410, list(result.raw_headers))
+                    await execute_telemetry(
+                        WebSocket(scope, receive, send), dummy_res, original_dep
+                    )
                 return
-            else:
+            elif matched_config.custom_response:
                 response = build_block_response(matched_config, result)
 
                 # Execute callback if configured
-                await execute_telemetry(request, response, original_dep)
+                if get_deprecation_callbacks():
+                    await execute_telemetry(
+                        Request(scope, receive), response, original_dep
+                    )
 
-                await response(scope, receive, send)
+                if is_shared_response(matched_config, response):
+                    await send_shared_response(response, send)
+                else:
+                    await response(scope, receive, send)
                 return
-
-        # 2. Warning Phase
-        status_code_captured = 200
-        headers_captured = []
-
-        async def send_wrapper(message: Message) -> None:
-            nonlocal status_code_captured, headers_captured
-            if message["type"] == "http.response.start":
-                status_code_captured = message["status"]
-                headers = MutableHeaders(scope=message)
-
-                apply_headers(headers, result.headers)
-                headers_captured = headers.raw
-            elif message["type"] == "websocket.accept":
-                # Inject headers into websocket accept response
-                ws_headers = message.get("headers", [])
-
-                # Convert dict to mutable headers for easier modification
-                # We need to create a dummy dict-like object to use apply_headers
-                header_dict = {}
-                for k, v in ws_headers:
-                    header_dict[k.decode("utf-8")] = v.decode("utf-8")
-
-                apply_headers(header_dict, result.headers)
-
-                # Rebuild ASGI headers list
-                new_ws_headers = []
-                for k, v in header_dict.items():
-                    new_ws_headers.append(
-                        (k.lower().encode("utf-8"), v.encode("utf-8"))
+            else:
+                # Default block responses are static: emit the ASGI messages directly
+                start = build_block_start_message(matched_config, result)
+
+                if get_deprecation_callbacks():
+                    await execute_telemetry(
+                        Request(scope, receive),
+                        _TelemetryResponse(start["status"], start["headers"]),
+                        original_dep,
                     )
 
-                message["headers"] = new_ws_headers
-
-            await send(message)
+                await send(start)
+                await send(
+                    {"type": "http.response.body", "body": matched_config._block_body}
+                )
+                return
 
+        # 2. Warning Phase
+        send_wrapper = _SendWrapper(send, result.raw_headers)
         await self.app(scope, receive, send_wrapper)
 
-        # Reconstruct response for callback
-        res = Response(status_code=status_code_captured)
-        res.raw_headers = headers_captured
-        await execute_telemetry(request, res, original_dep)
+        if get_deprecation_callbacks():
+            if scope["type"] == "websocket":
+                from starlette.websockets import WebSocket
+
+                request = WebSocket(scope, receive, send)
+            else:
+                request = Request(scope, receive)
+
+            # Status and headers of the streamed response, without rebuilding a Response
+            res = _TelemetryResponse(send_wrapper.status, send_wrapper.headers)
+            await execute_telemetry(request, res, original_dep)
@@ -1,6 +1,7 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.routing import APIRoute
-from starlette.routing import Mount
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
 
 from datetime import datetime, timezone
 
@@ -9,7 +10,12 @@ from .dependencies import (
     sunset_exception_handler,
     DeprecationDependency,
 )
-from .middleware import DeprecationMiddleware
+from .middleware import (
+    DeprecationMiddleware,
+    PrefixIndex,
+    build_prefix_index,
+    match_prefix,
+)
 
 
 def auto_deprecate_openapi(app: FastAPI, always_rebuild: bool = True):
@@ -28,7 +34,9 @@ def auto_deprecate_openapi(app: FastAPI, always_rebuild: bool = True):
                 if mw.cls == DeprecationMiddleware:
                     mw_configs = mw.kwargs.get("deprecations", {})
                     for p, d in mw_configs.items():
-                        deps[p] = d.config if hasattr(d, "config") else d
+                        deps[p] = (
+                            d.config if isinstance(d, DeprecationDependency) else d
+                        )
         return deps
 
     def wrap_app(
@@ -36,10 +44,15 @@ def auto_deprecate_openapi(app: FastAPI, always_rebuild: bool = True):
     ):
         local_deps = extract_deps(target_app)
         combined_deps = {**parent_global_deps, **local_deps}
+        global_index = build_prefix_index(combined_deps)
 
         original_openapi = target_app.openapi
+        # (route identities, deprecated routes): which routes are deprecated only
+        # changes with the route table, the rendered phase depends on the time
+        resolved_routes = None
 
         def custom_openapi():
+            nonlocal resolved_routes
             if not always_rebuild and getattr(
                 target_app, "_custom_openapi_schema", None
             ):
@@ -55,13 +68,20 @@ def auto_deprecate_openapi(app: FastAPI, always_rebuild: bool = True):
                 "RFC8594",
             ]
 
+            routes = target_app.routes
+            route_ids = tuple(map(id, routes))
+            if resolved_routes is None or resolved_routes[0] != route_ids:
+                resolved_routes = (
+                    route_ids,
+                    _resolve_deprecated_routes(
+                        routes,
+                        prefix_for_globals=prefix_for_globals,
+                        global_deps=global_index,
+                    ),
+                )
+
             # Dynamically inject deprecations into the fresh schema
-            _apply_dynamic_deprecations(
-                target_app.routes,
-                openapi_schema,
-                prefix_for_globals=prefix_for_globals,
-                global_deps=combined_deps,
-            )
+            _apply_dynamic_deprecations(resolved_routes[1], openapi_schema)
 
             if not always_rebuild:
                 target_app._custom_openapi_schema = openapi_schema
@@ -69,6 +89,8 @@ def auto_deprecate_openapi(app: FastAPI, always_rebuild: bool = True):
             return openapi_schema
 
         target_app.openapi = custom_openapi
+        if not always_rebuild:
+            _cache_openapi_route(target_app)
 
         # Find mounted sub-apps
         for route in target_app.routes:
@@ -81,10 +103,44 @@ def auto_deprecate_openapi(app: FastAPI, always_rebuild: bool = True):
     wrap_app(app, "", extract_deps(app))
 
 
-def _apply_dynamic_deprecations(
-    routes, openapi_schema: dict, prefix_for_globals: str, global_deps: dict
-):
-    paths = openapi_schema.get("paths", {})
+def _cache_openapi_route(target_app: FastAPI) -> None:
+    """
+    Serve `openapi_url` from the encoded schema bytes. The schema is only re-encoded
+    when `app.openapi()` returns a new schema object (or the root path changes).
+    """
+    if not target_app.openapi_url:
+        return
+
+    # (schema, root path, encoded body) of the last served schema
+    cached = (None, None, b"")
+
+    async def openapi(req: Request) -> Response:
+        nonlocal cached
+        root_path = req.scope.get("root_path", "").rstrip("/")
+        schema = target_app.openapi()
+        if cached[0] is not schema or cached[1] != root_path:
+            # Same servers handling as FastAPI's own openapi_url endpoint
+            served = schema
+            if root_path and target_app.root_path_in_servers:
+                server_urls = {s.get("url") for s in schema.get("servers", [])}
+                if root_path not in server_urls:
+                    served = dict(schema)
+                    served["servers"] = [{"url": root_path}] + schema.get("servers", [])
+            cached = (schema, root_path, JSONResponse(served).body)
+        return Response(cached[2], media_type="application/json")
+
+    routes = target_app.router.routes
+    for i, route in enumerate(routes):
+        if type(route) is Route and route.path == target_app.openapi_url:
+            routes[i] = Route(target_app.openapi_url, openapi, include_in_schema=False)
+            break
+
+
+def _resolve_deprecated_routes(
+    routes, prefix_for_globals: str, global_deps: PrefixIndex
+) -> list:
+    """Pair every deprecated APIRoute with the config that deprecates it."""
+    resolved = []
     for route in routes:
         if isinstance(route, APIRoute):
             route_path = prefix_for_globals + getattr(route, "path", "")
@@ -93,113 +149,118 @@ def _apply_dynamic_deprecations(
             dep_info = getattr(route.endpoint, "__deprecation__", None)
 
             # 2. Check Router Dependencies
-            if not dep_info and hasattr(route, "dependencies"):
+            if not dep_info:
                 for dep in route.dependencies:
-                    if hasattr(dep, "dependency") and isinstance(
-                        dep.dependency, DeprecationDependency
-                    ):
+                    if isinstance(dep.dependency, DeprecationDependency):
                         dep_info = dep.dependency.config
                         break
 
             # 3. Check Global Middleware
             if not dep_info:
-                matched_prefix = ""
-                for p, d in global_deps.items():
-                    if route_path.startswith(p) and len(p) > len(matched_prefix):
-                        matched_prefix = p
-                        dep_info = d
+                dep_info = match_prefix(global_deps, route_path)
 
-            # 4. Apply deprecation info to the generated schema dynamically
             if dep_info:
-                now = datetime.now(timezone.utc)
-                is_active_deprecation = True
-
-                if dep_info.deprecation_date and dep_info.deprecation_date > now:
-                    is_active_deprecation = False
-
-                scheduled_brownouts = (
-                    [
-                        {"start": b[0].isoformat(), "end": b[1].isoformat()}
-                        for b in dep_info.brownouts
-                    ]
-                    if dep_info.brownouts
-                    else []
-                )
+                resolved.append((route, dep_info))
+    return resolved
 
-                deprecation_date = (
-                    dep_info.deprecation_date.isoformat()
-                    if dep_info.deprecation_date
-                    else None
-                )
-                sunset_date = (
-                    dep_info.sunset_date.isoformat() if dep_info.sunset_date else None
-                )
-                is_sunset = dep_info.sunset_date and dep_info.sunset_date <= now
-                chaotic_brownouts = (
-                    dep_info.brownout_probability > 0 or dep_info.progressive_brownout
-                )
 
-                deprecation_meta = {
-                    "deprecated": is_active_deprecation,
-                    "deprecationDate": deprecation_date,
-                    "sunsetDate": sunset_date,
-                    "alternative": dep_info.alternative,
-                    "link": dep_info.link,
-                    "links": dep_info.links,
-                    "phase": "warning" if not is_sunset else "sunset",
-                    "scheduledBrownouts": scheduled_brownouts,
-                    "chaoticBrownouts": chaotic_brownouts,
-                    "detail": dep_info.detail,
-                }
-
-                # Exclude null values and empty collections to keep the OpenAPI schema clean
-                deprecation_meta = {
-                    k: v
-                    for k, v in deprecation_meta.items()
-                    if v is not None and not (isinstance(v, (list, dict)) and not v)
-                }
-
-                # Setup description message
-                if not is_active_deprecation:
-                    warning_msg = " **UPCOMING DEPRECATION**"
-                else:
-                    warning_msg = " **DEPRECATED**"
-
-                if dep_info.deprecation_date:
-                    dt_str = dep_info.deprecation_date.isoformat()
-                    warning_msg += f". Deprecated since {dt_str}."
-
-                if dep_info.sunset_date:
-                    sunset_str = dep_info.sunset_date.isoformat()
-                    warning_msg += f" Sunset date: {sunset_str}."
-
-                if dep_info.alternative:
-                    warning_msg += f" Alternative: {dep_info.alternative}."
-
-                if dep_info.link:
-                    warning_msg += f" See: {dep_info.link}."
-
-                if dep_info.links:
-                    links_str = ", ".join(dep_info.links.values())
-                    warning_msg += f" See also: {links_str}."
-
-                # Find the route operation in the schema to mutate it
-                path_key = route.path_format
-                for method in route.methods:
-                    method_str = method.lower()
-                    if path_key in paths and method_str in paths[path_key]:
-                        operation = paths[path_key][method_str]
-
-                        if is_active_deprecation:
-                            operation["deprecated"] = True
-
-                        operation["x-fastapi-deprecation"] = deprecation_meta
-
-                        existing_desc = operation.get("description", "")
-                        if warning_msg not in existing_desc:
-                            if existing_desc:
-                                operation["description"] = (
-                                    existing_desc + f"\n\n{warning_msg}"
-                                )
-                            else:
-                                operation["description"] = warning_msg
+def _apply_dynamic_deprecations(resolved_routes: list, openapi_schema: dict):
+    paths = openapi_schema.get("paths", {})
+    now = datetime.now(timezone.utc)
+    # Routes sharing a schedule render identical metadata, build it once per config
+    rendered = {}
+    for route, dep_info in resolved_routes:
+        # Apply deprecation info to the generated schema dynamically
+        key = id(dep_info)
+        if key not in rendered:
+            rendered[key] = _render_deprecation(dep_info, now)
+        is_active_deprecation, deprecation_meta, warning_msg = rendered[key]
+
+        # Find the route operation in the schema to mutate it
+        path_key = route.path_format
+        for method in route.methods:
+            method_str = method.lower()
+            if path_key in paths and method_str in paths[path_key]:
+                operation = paths[path_key][method_str]
+
+                if is_active_deprecation:
+                    operation["deprecated"] = True
+
+                operation["x-fastapi-deprecation"] = deprecation_meta
+
+                existing_desc = operation.get("description", "")
+                if warning_msg not in existing_desc:
+                    if existing_desc:
+                        operation["description"] = existing_desc + f"\n\n{warning_msg}"
+                    else:
+                        operation["description"] = warning_msg
+
+
+def _render_deprecation(dep_info, now: datetime) -> tuple[bool, dict, str]:
+    """Build the `deprecated` flag, the x-fastapi-deprecation metadata and the description note."""
+    is_active_deprecation = True
+
+    if dep_info.deprecation_date and dep_info.deprecation_date > now:
+        is_active_deprecation = False
+
+    scheduled_brownouts = (
+        [
+            {"start": b[0].isoformat(), "end": b[1].isoformat()}
+            for b in dep_info.brownouts
+        ]
+        if dep_info.brownouts
+        else []
+    )
+
+    deprecation_date = (
+        dep_info.deprecation_date.isoformat() if dep_info.deprecation_date else None
+    )
+    sunset_date = dep_info.sunset_date.isoformat() if dep_info.sunset_date else None
+    is_sunset = dep_info.sunset_date and dep_info.sunset_date <= now
+    chaotic_brownouts = (
+        dep_info.brownout_probability > 0 or dep_info.progressive_brownout
+    )
+
+    deprecation_meta = {
+        "deprecated": is_active_deprecation,
+        "deprecationDate": deprecation_date,
+        "sunsetDate": sunset_date,
+        "alternative": dep_info.alternative,
+        "link": dep_info.link,
+        "links": dep_info.links,
+        "phase": "warning" if not is_sunset else "sunset",
+        "scheduledBrownouts": scheduled_brownouts,
+        "chaoticBrownouts": chaotic_brownouts,
+        "detail": dep_info.detail,
+    }
+
+    # Exclude null values and empty collections to keep the OpenAPI schema clean
+    deprecation_meta = {
+        k: v
+        for k, v in deprecation_meta.items()
+        if v is not None and not (isinstance(v, (list, dict)) and not v)
+    }
+
+    # Setup description message
+    if not is_active_deprecation:
+        warning_msg = " **UPCOMING DEPRECATION**"
+    else:
+        warning_msg = " **DEPRECATED**"
+
+    if dep_info.deprecation_date:
+        warning_msg += f". Deprecated since {deprecation_date}."
+
+    if dep_info.sunset_date:
+        warning_msg += f" Sunset date: {sunset_date}."
+
+    if dep_info.alternative:
+        warning_msg += f" Alternative: {dep_info.alternative}."
+
+    if dep_info.link:
+        warning_msg += f" See: {dep_info.link}."
+
+    if dep_info.links:
+        links_str = ", ".join(dep_info.links.values())
+        warning_msg += f" See also: {links_str}."
+
+    return is_active_deprecation, deprecation_meta, warning_msg
@@ -3,7 +3,6 @@ import time
 from typing import AsyncGenerator, Iterator
 
 from .engine import DeprecationConfig, process_deprecation, ActionType
-from datetime import datetime, timezone
 
 
 async def deprecated_sse_generator(
@@ -24,8 +23,7 @@ async def deprecated_sse_generator(
             # Throttle processing to at most once per second for high-throughput streams
             current_time = time.monotonic()
             if current_time - last_check_time >= 1.0:
-                now = datetime.now(timezone.utc)
-                result = process_deprecation(config, now)
+                result = process_deprecation(config)
                 last_check_time = current_time
 
                 if result.action == ActionType.BLOCK:
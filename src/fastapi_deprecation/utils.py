@@ -1,3 +1,4 @@
+import functools
 from datetime import date, datetime, timezone
 from email.utils import format_datetime
 from typing import Union
@@ -13,7 +14,7 @@ def parse_date(value: DateInput) -> datetime:
     Supports:
     - datetime (converted to UTC)
     - date (converted to UTC midnight)
-    - str (parsed via dateutil, assumed UTC if allowed, or local if implied)
+    - str (ISO 8601, or any format dateutil understands; naive values assumed UTC)
     - int/float (Unix timestamp)
     """
     if isinstance(value, datetime):
@@ -29,25 +30,37 @@ def parse_date(value: DateInput) -> datetime:
         return datetime.fromtimestamp(value, tz=timezone.utc)
 
     if isinstance(value, str):
-        try:
-            dt = dateutil.parser.parse(value)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except (ValueError, OverflowError):
-            raise ValueError(f"Invalid date string: {value}")
+        return _parse_date_string(value)
 
     raise TypeError(f"Unsupported date type: {type(value)}")
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_date_string(value: str) -> datetime:
+    # Schedules reuse a handful of date strings across many routes, and dateutil is slow
+    try:
+        # ISO 8601 is the common case; fromisoformat() only accepts a trailing "Z"
+        # from Python 3.11, so spell it out as an offset
+        iso_value = value[:-1] + "+00:00" if value.endswith("Z") else value
+        dt = datetime.fromisoformat(iso_value)
+    except ValueError:
+        dt = None
+    try:
+        if dt is None:
+            dt = dateutil.parser.parse(value)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except (ValueError, OverflowError):
+        raise ValueError(f"Invalid date string: {value}")
+
+
 def format_deprecation_date(value: DateInput) -> str:
     """
     Format date for 'Deprecation' header (RFC 9745).
     Format: @<timestamp> (RFC 9651 Date)
     """
-    dt = parse_date(value)
-    timestamp = int(dt.timestamp())
-    return f"@{timestamp}"
+    return _format_deprecation_from_ts(parse_date(value).timestamp())
 
 
 def format_sunset_date(value: DateInput) -> str:
@@ -57,3 +70,8 @@ def format_sunset_date(value: DateInput) -> str:
     """
     dt = parse_date(value)
     return format_datetime(dt, usegmt=True)
+
+
+def _format_deprecation_from_ts(timestamp: float) -> str:
+    # Fast path for already-normalized inputs, skips parse_date
+    return f"@{int(timestamp)}"
@@ -1,5 +1,4 @@
 import time
-from datetime import datetime, timezone
 from typing import Any, Optional
 
 from fastapi import WebSocket
@@ -14,6 +13,13 @@ from .engine import (
 )
 
 
+def _policy_violation(config: DeprecationConfig) -> WebSocketException:
+    return WebSocketException(
+        code=status.WS_1008_POLICY_VIOLATION,
+        reason=config.detail or "Endpoint Sunset",
+    )
+
+
 class DeprecatedWebSocket:
     """
     A wrapper around a standard FastAPI WebSocket that automatically injects
@@ -32,14 +38,10 @@ class DeprecatedWebSocket:
         """Evaluate deprecation status mid-stream, throttled to 1 second."""
         current_time = time.monotonic()
         if current_time - self._last_check_time >= 1.0:
-            now = datetime.now(timezone.utc)
-            result = process_deprecation(self._config, now)
+            result = process_deprecation(self._config)
             self._last_check_time = current_time
             if result.action == ActionType.BLOCK:
-                raise WebSocketException(
-                    code=status.WS_1008_POLICY_VIOLATION,
-                    reason=self._config.detail or "Endpoint Sunset",
-                )
+                raise _policy_violation(self._config)
 
     def __getattr__(self, name: str) -> Any:
         # Proxy all attributes to the underlying websocket
@@ -54,9 +56,7 @@ class DeprecatedWebSocket:
         Accept the websocket connection, injecting deprecation headers.
         """
         header_list = list(headers) if headers else []
-
-        for k, v in self._result.headers.items():
-            header_list.append((k.lower().encode("utf-8"), v.encode("utf-8")))
+        header_list.extend(self._result.raw_headers)
 
         await self._websocket.accept(subprotocol=subprotocol, headers=header_list)
 
@@ -66,10 +66,7 @@ class DeprecatedWebSocket:
         hasn't been accepted yet, or raise an exception.
         """
         # FastAPI typically expects a WebSocketException if we are rejecting a route
-        raise WebSocketException(
-            code=status.WS_1008_POLICY_VIOLATION,
-            reason=config.detail or "Endpoint Sunset",
-        )
+        raise _policy_violation(config)
 
     async def receive_text(self, *args, **kwargs) -> str:
         self._check_deprecation()
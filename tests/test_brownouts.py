@@ -29,9 +29,8 @@ client = TestClient(app)
 def test_brownout_active():
     # Inside window 1
     mock_now = datetime(2025, 1, 1, 11, 0, 0, tzinfo=timezone.utc)
-    with patch("fastapi_deprecation.dependencies.datetime") as mock_dt:
-        mock_dt.now.return_value = mock_now
-        mock_dt.side_effect = datetime
+    with patch("fastapi_deprecation.engine.time") as mock_time:
+        mock_time.time.return_value = mock_now.timestamp()
 
         response = client.get("/brownout")
         assert response.status_code == 410
@@ -41,9 +40,8 @@ def test_brownout_active():
 def test_brownout_inactive():
     # Before window 1
     mock_now = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-    with patch("fastapi_deprecation.dependencies.datetime") as mock_dt:
-        mock_dt.now.return_value = mock_now
-        mock_dt.side_effect = datetime
+    with patch("fastapi_deprecation.engine.time") as mock_time:
+        mock_time.time.return_value = mock_now.timestamp()
 
         response = client.get("/brownout")
         assert response.status_code == 200
@@ -51,9 +49,8 @@ def test_brownout_inactive():
 
     # Between windows
     mock_now_between = datetime(2025, 1, 1, 13, 0, 0, tzinfo=timezone.utc)
-    with patch("fastapi_deprecation.dependencies.datetime") as mock_dt:
-        mock_dt.now.return_value = mock_now_between
-        mock_dt.side_effect = datetime
+    with patch("fastapi_deprecation.engine.time") as mock_time:
+        mock_time.time.return_value = mock_now_between.timestamp()
 
         response = client.get("/brownout")
         assert response.status_code == 200
@@ -62,10 +59,36 @@ def test_brownout_inactive():
 def test_brownout_custom_detail():
     # Test detail override
     mock_now = datetime(2025, 1, 2, 11, 0, 0, tzinfo=timezone.utc)  # Inside window 2
-    with patch("fastapi_deprecation.dependencies.datetime") as mock_dt:
-        mock_dt.now.return_value = mock_now
-        mock_dt.side_effect = datetime
+    with patch("fastapi_deprecation.engine.time") as mock_time:
+        mock_time.time.return_value = mock_now.timestamp()
 
         response = client.get("/brownout")
         assert response.status_code == 410
         assert response.json()["detail"] == "Service is in a scheduled brownout."
+
+
+def test_overlapping_brownout_windows():
+    from fastapi_deprecation.engine import (
+        ActionType,
+        DeprecationConfig,
+        process_deprecation,
+    )
+
+    config = DeprecationConfig(
+        brownouts=[
+            (
+                datetime(2025, 1, 1, 8, tzinfo=timezone.utc),
+                datetime(2025, 1, 1, 18, tzinfo=timezone.utc),
+            ),
+            (
+                datetime(2025, 1, 1, 10, tzinfo=timezone.utc),
+                datetime(2025, 1, 1, 11, tzinfo=timezone.utc),
+            ),
+        ]
+    )
+
+    # Past the end of the latest-starting window, but still inside the first one
+    inside = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    after = datetime(2025, 1, 1, 19, tzinfo=timezone.utc)
+    assert process_deprecation(config, inside).action == ActionType.BLOCK
+    assert process_deprecation(config, after).action == ActionType.WARN
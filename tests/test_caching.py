@@ -1,4 +1,6 @@
 from datetime import datetime, timezone, timedelta
+
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from fastapi_deprecation import (
@@ -8,72 +10,79 @@ from fastapi_deprecation import (
 )
 
 
-def test_cache_control_decorator():
+@pytest.fixture(scope="module")
+def client():
     app = FastAPI()
 
-    # Set sunset 1 hour from now
     now = datetime.now(timezone.utc)
-    sunset_dt = now + timedelta(hours=1)
-
-    @app.get("/api/test")
-    @deprecated(sunset_date=sunset_dt, inject_cache_control=True)
-    def test_ep():
-        return {"msg": "hello"}
-
-    client = TestClient(app)
-    res = client.get("/api/test")
-
-    assert res.status_code == 200
-    assert "Cache-Control" in res.headers
-    # Expect max-age around 3600 +/- 1
-    assert (
-        "max-age=359" in res.headers["Cache-Control"]
-        or "max-age=360" in res.headers["Cache-Control"]
-    )
-
-
-def test_cache_control_middleware():
-    app = FastAPI()
-
-    now = datetime.now(timezone.utc)
-    sunset_dt = now + timedelta(minutes=5)
 
     app.add_middleware(
         DeprecationMiddleware,
         deprecations={
             "/api/v1": DeprecationDependency(
-                sunset_date=sunset_dt, inject_cache_control=True
+                sunset_date=now + timedelta(minutes=5), inject_cache_control=True
             )
         },
     )
 
+    @app.get("/api/test")
+    @deprecated(sunset_date=now + timedelta(hours=1), inject_cache_control=True)
+    def test_ep():
+        return {"msg": "hello"}
+
     @app.get("/api/v1/test")
     def test_v1():
         return {"msg": "v1"}
 
-    client = TestClient(app)
-    res = client.get("/api/v1/test")
+    @app.get("/api/no-cache")
+    @deprecated(sunset_date=now + timedelta(hours=1))
+    def test_no_cache():
+        return {"msg": "hello"}
 
-    assert res.status_code == 200
-    assert "Cache-Control" in res.headers
-    assert (
-        "max-age=29" in res.headers["Cache-Control"]
-        or "max-age=30" in res.headers["Cache-Control"]
-    )
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-def test_cache_control_disabled_by_default():
-    app = FastAPI()
-    now = datetime.now(timezone.utc)
-    sunset_dt = now + timedelta(hours=1)
+@pytest.mark.parametrize(
+    "path, expected_max_age",
+    [
+        # Decorator, sunset 1 hour from now: expect max-age around 3600 +/- 1
+        ("/api/test", ("max-age=359", "max-age=360")),
+        # Middleware, sunset 5 minutes from now
+        ("/api/v1/test", ("max-age=29", "max-age=30")),
+    ],
+    ids=["decorator", "middleware"],
+)
+def test_cache_control(client, path, expected_max_age):
+    res = client.get(path)
+
+    assert res.status_code == 200
+    assert "Cache-Control" in res.headers
+    assert any(prefix in res.headers["Cache-Control"] for prefix in expected_max_age)
 
-    @app.get("/api/no-cache")
-    @deprecated(sunset_date=sunset_dt)
-    def test_no_cache():
-        return {"msg": "hello"}
 
-    client = TestClient(app)
+def test_cache_control_disabled_by_default(client):
     res = client.get("/api/no-cache")
 
     if "Cache-Control" in res.headers:
         assert "max-age" not in res.headers["Cache-Control"]
+
+
+def test_raw_headers_match_headers():
+    from fastapi_deprecation.engine import (
+        DeprecationConfig,
+        encode_headers,
+        process_deprecation,
+    )
+
+    now = datetime.now(timezone.utc)
+    config = DeprecationConfig(
+        sunset_date=now + timedelta(hours=1),
+        links={"successor-version": "/v2"},
+        cache_tag="legacy",
+        inject_cache_control=True,
+    )
+
+    result = process_deprecation(config)
+    assert "Cache-Control" in result.headers
+    assert list(result.raw_headers) == encode_headers(result.headers)
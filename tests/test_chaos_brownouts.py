@@ -1,4 +1,6 @@
 from unittest.mock import patch
+
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from fastapi_deprecation import deprecated
@@ -31,22 +33,25 @@ async def progressive_brownout():
     return {"message": "success"}
 
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-def test_static_brownout_success():
+def test_static_brownout_success(client):
     with patch("random.random", return_value=0.6):
         response = client.get("/static-brownout")
         assert response.status_code == 200
 
 
-def test_static_brownout_failure():
+def test_static_brownout_failure(client):
     with patch("random.random", return_value=0.4):
         response = client.get("/static-brownout")
         assert response.status_code == 410
 
 
-def test_progressive_brownout_success():
+def test_progressive_brownout_success(client):
     # We are exactly 50% through the life cycle (5 days past dep, 5 days until sunset).
     # Probability should be 0.5. A random of 0.6 should result in success.
     with patch("random.random", return_value=0.6):
@@ -54,7 +59,7 @@ def test_progressive_brownout_success():
         assert response.status_code == 200
 
 
-def test_progressive_brownout_failure():
+def test_progressive_brownout_failure(client):
     # Probability is 0.5. A random of 0.4 should result in failure.
     with patch("random.random", return_value=0.4):
         response = client.get("/progressive-brownout")
@@ -62,7 +67,6 @@ def test_progressive_brownout_failure():
 
 
 def test_validation_mutually_exclusive():
-    import pytest
     from fastapi_deprecation import DeprecationDependency
 
     with pytest.raises(
@@ -76,7 +80,6 @@ def test_validation_mutually_exclusive():
 
 
 def test_validation_progressive_requirements():
-    import pytest
     from fastapi_deprecation import DeprecationDependency
 
     with pytest.raises(
@@ -90,7 +93,6 @@ def test_validation_progressive_requirements():
 
 
 def test_validation_probability_bounds():
-    import pytest
     from fastapi_deprecation import DeprecationDependency
 
     with pytest.raises(
@@ -106,3 +108,19 @@ def test_validation_probability_bounds():
         DeprecationDependency(
             brownout_probability=-0.1,
         )
+
+
+def test_static_brownout_rolled_within_cached_second():
+    from fastapi_deprecation.engine import DeprecationConfig, process_deprecation
+
+    config = DeprecationConfig(brownout_probability=0.5)
+    request_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    with patch("random.random", return_value=0.6):
+        first = process_deprecation(config, request_time)
+    with patch("random.random", return_value=0.4):
+        second = process_deprecation(config, request_time)
+
+    assert first.action.value == "WARN"
+    assert second.action.value == "BLOCK"
+    assert first.headers["Deprecation"] == second.headers["Deprecation"]
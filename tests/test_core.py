@@ -51,6 +51,28 @@ def dec_explicit(request: Request, response: Response):
     return {"msg": "explicit"}
 
 
+@app.get("/dec-string-annotations")
+@deprecated()
+def dec_string_annotations(limit: "int"):
+    return {"limit": limit}
+
+
+@app.api_route(
+    "/dep-skip-methods",
+    methods=["GET", "HEAD", "OPTIONS"],
+    dependencies=[
+        Depends(
+            DeprecationDependency(
+                sunset_date=datetime(2000, 1, 1),
+                skip_methods=frozenset({"OPTIONS", "HEAD"}),
+            )
+        )
+    ],
+)
+def dep_skip_methods():
+    return {"msg": "gone"}
+
+
 client = TestClient(app)
 
 
@@ -72,6 +94,39 @@ def test_dep_redirect():
     assert response.headers["Location"] == "/new"
 
 
+def test_dep_skip_methods():
+    assert client.get("/dep-skip-methods").status_code == 410
+
+    for method in ("OPTIONS", "HEAD"):
+        response = client.request(method, "/dep-skip-methods")
+        assert response.status_code == 200
+        assert "Deprecation" not in response.headers
+
+
+def test_dep_sunset_headers_not_shared_with_exception_handlers():
+    from fastapi import HTTPException
+    from fastapi.exception_handlers import http_exception_handler
+
+    handler_app = FastAPI()
+
+    @handler_app.exception_handler(HTTPException)
+    async def tag_user(request: Request, exc: HTTPException):
+        exc.headers.setdefault("X-User", request.query_params["user"])
+        return await http_exception_handler(request, exc)
+
+    @handler_app.get(
+        "/gone", dependencies=[Depends(DeprecationDependency(sunset_date="2020-01-01"))]
+    )
+    def gone():
+        return {}
+
+    handler_client = TestClient(handler_app)
+
+    # Both requests normally fall within the same cached second
+    assert handler_client.get("/gone?user=alice").headers["X-User"] == "alice"
+    assert handler_client.get("/gone?user=bob").headers["X-User"] == "bob"
+
+
 def test_invalid_dates():
     import pytest
     from datetime import timedelta
@@ -91,6 +146,23 @@ def test_dec_simple():
     assert "Deprecation" in response.headers
 
 
+def test_dec_keeps_attributes_of_stacked_decorators():
+    def rate_limited(limit):
+        def mark(func):
+            func.rate_limit = limit
+            return func
+
+        return mark
+
+    @deprecated(deprecation_date="2020-01-01")
+    @rate_limited("10/minute")
+    def endpoint():
+        return {}
+
+    assert endpoint.rate_limit == "10/minute"
+    assert endpoint.__deprecation__.deprecation_date is not None
+
+
 def test_dec_args():
     response = client.get("/dec-args")
     assert response.status_code == 200
@@ -103,3 +175,28 @@ def test_dec_explicit():
     response = client.get("/dec-explicit")
     assert response.status_code == 200
     assert "Deprecation" in response.headers
+
+
+def test_dec_string_annotations():
+    assert not hasattr(dec_string_annotations, "__wrapped__")
+    assert dec_string_annotations.__name__ == "dec_string_annotations"
+
+    response = client.get("/dec-string-annotations", params={"limit": "5"})
+    assert response.status_code == 200
+    assert response.json() == {"limit": 5}
+    assert "Deprecation" in response.headers
+
+    assert client.get("/dec-string-annotations?limit=abc").status_code == 422
+
+
+def test_shared_dependency_instances():
+    kwargs = dict(
+        sunset_date="2030-01-01",
+        links={"successor-version": "/v2"},
+        brownouts=[("2029-01-01", "2029-01-02")],
+    )
+
+    shared = DeprecationDependency.get(**kwargs)
+    assert DeprecationDependency.get(**kwargs) is shared
+    assert DeprecationDependency.get(sunset_date="2031-01-01") is not shared
+    assert shared.links == {"successor-version": "/v2"}
@@ -78,3 +78,120 @@ def test_dependency_custom_response():
     assert res.status_code == 410
     assert res.json() == {"message": "Custom Error via Dependency"}
     assert "Sunset" in res.headers
+
+
+def test_custom_response_instance_headers_applied_once():
+    app = FastAPI()
+
+    custom_res = JSONResponse(content={"message": "Gone"}, status_code=410)
+
+    @app.get("/api/v1/links")
+    @deprecated(
+        sunset_date="2020-01-01",
+        links={"successor-version": "/api/v2/links"},
+        response=custom_res,
+    )
+    def test_links():
+        return {"msg": "v1"}
+
+    client = TestClient(app)
+
+    first = client.get("/api/v1/links")
+    second = client.get("/api/v1/links")
+    assert second.status_code == 410
+    assert "successor-version" in second.headers["Link"]
+    assert second.headers["Link"] == first.headers["Link"]
+
+
+def test_custom_response_instance_shared_by_two_schedules():
+    app = FastAPI()
+
+    gone = JSONResponse(content={"message": "Gone"}, status_code=410)
+
+    @app.get("/a")
+    @deprecated(sunset_date="2020-01-01", response=gone)
+    def endpoint_a():
+        return {"msg": "a"}
+
+    @app.get("/b")
+    @deprecated(sunset_date="2021-01-01", response=gone)
+    def endpoint_b():
+        return {"msg": "b"}
+
+    client = TestClient(app)
+
+    assert client.get("/a").headers["Sunset"] == "Wed, 01 Jan 2020 00:00:00 GMT"
+    assert client.get("/b").headers["Sunset"] == "Fri, 01 Jan 2021 00:00:00 GMT"
+    # The caller's instance is left untouched
+    assert "sunset" not in gone.headers
+
+
+class TagMiddleware:
+    # Edits the header list in place, like MutableHeaders(scope=message) does
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"].append((b"x-tag", b"1"))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def test_middleware_shared_custom_response_headers_not_leaked():
+    from fastapi_deprecation import DeprecationMiddleware
+
+    app = FastAPI()
+    custom_res = JSONResponse(content={"message": "Gone"}, status_code=410)
+    app.add_middleware(
+        DeprecationMiddleware,
+        deprecations={
+            "/api/v1": DeprecationDependency(
+                sunset_date="2020-01-01", response=custom_res
+            )
+        },
+    )
+    app.add_middleware(TagMiddleware)
+
+    client = TestClient(app)
+
+    for _ in range(2):
+        res = client.get("/api/v1/items")
+        assert res.status_code == 410
+        assert res.json() == {"message": "Gone"}
+        assert res.headers.get_list("x-tag") == ["1"]
+
+
+def test_shared_custom_response_headers_not_leaked():
+    app = FastAPI()
+    auto_deprecate_openapi(app)
+    custom_res = JSONResponse(content={"message": "Gone"}, status_code=410)
+
+    @app.get("/api/v1/decorated")
+    @deprecated(sunset_date="2020-01-01", response=custom_res)
+    def decorated():
+        return {"msg": "v1"}
+
+    @app.get(
+        "/api/v1/dependency",
+        dependencies=[
+            Depends(
+                DeprecationDependency(sunset_date="2020-01-01", response=custom_res)
+            )
+        ],
+    )
+    def dependency():
+        return {"msg": "v1"}
+
+    app.add_middleware(TagMiddleware)
+
+    client = TestClient(app)
+
+    for path in ("/api/v1/decorated", "/api/v1/dependency"):
+        for _ in range(3):
+            res = client.get(path)
+            assert res.status_code == 410
+            assert res.json() == {"message": "Gone"}
+            assert res.headers.get_list("x-tag") == ["1"]
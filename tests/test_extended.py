@@ -1,10 +1,15 @@
+import asyncio
+
+import pytest
 from fastapi import FastAPI, Request, Response
 from fastapi.testclient import TestClient
 from fastapi_deprecation import (
     deprecated,
+    flush_deprecation_callbacks,
     set_deprecation_callback,
     DeprecationDependency,
 )
+from fastapi_deprecation.engine import _DEPRECATION_CALLBACKS, execute_telemetry
 
 app = FastAPI()
 
@@ -54,3 +59,83 @@ def test_telemetry():
     assert len(callback_hits) == 1
     assert callback_hits[0]["path"] == "/telemetry"
     assert callback_hits[0]["detail"] is not None
+
+
+class AsyncRecorder:
+    # Callable object with an async __call__, not a coroutine function
+    def __init__(self):
+        self.hits = []
+
+    async def __call__(self, request, response, dep):
+        self.hits.append(dep)
+
+
+@pytest.fixture
+def isolated_callbacks():
+    # Run with only the callbacks the test registers, then restore the module's own
+    registered = list(_DEPRECATION_CALLBACKS)
+    _DEPRECATION_CALLBACKS.clear()
+    yield
+    _DEPRECATION_CALLBACKS[:] = registered
+
+
+@pytest.mark.asyncio
+async def test_background_telemetry(isolated_callbacks):
+    background_hits = []
+
+    async def slow_callback(request, response, dep):
+        background_hits.append(dep)
+
+    set_deprecation_callback(slow_callback, background=True)
+    await execute_telemetry(None, None, "dep")
+    # Queued, not awaited on the request path
+    assert background_hits == []
+
+    await asyncio.sleep(0.01)
+    assert background_hits == ["dep"]
+
+
+@pytest.mark.asyncio
+async def test_background_async_callable_telemetry(isolated_callbacks):
+    recorder = AsyncRecorder()
+
+    set_deprecation_callback(recorder, background=True)
+    await execute_telemetry(None, None, "dep")
+    await asyncio.sleep(0.01)
+    assert recorder.hits == ["dep"]
+
+
+@pytest.mark.asyncio
+async def test_flush_background_telemetry(isolated_callbacks):
+    recorder = AsyncRecorder()
+
+    set_deprecation_callback(recorder, background=True)
+    await execute_telemetry(None, None, "first")
+    await execute_telemetry(None, None, "second")
+
+    # Drains the queue without waiting on the event loop to get to it
+    await flush_deprecation_callbacks()
+    assert recorder.hits == ["first", "second"]
+    assert _DEPRECATION_CALLBACKS[0]._task is None
+
+
+@pytest.mark.asyncio
+async def test_async_callable_telemetry(isolated_callbacks):
+    recorder = AsyncRecorder()
+
+    set_deprecation_callback(recorder)
+    await execute_telemetry(None, None, "dep")
+    assert recorder.hits == ["dep"]
+
+
+@pytest.mark.asyncio
+async def test_async_callable_telemetry_failure_is_logged(isolated_callbacks, caplog):
+    class FailingRecorder:
+        async def __call__(self, request, response, dep):
+            raise RuntimeError("boom")
+
+    set_deprecation_callback(FailingRecorder())
+    # Logged instead of failing the request
+    await execute_telemetry(None, None, "dep")
+    assert "Telemetry callback failed" in caplog.text
+    assert "boom" in caplog.text
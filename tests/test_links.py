@@ -1,9 +1,11 @@
+import httpx
+import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from fastapi_deprecation import DeprecationMiddleware, DeprecationDependency, deprecated
 
 
-def test_multiple_link_relations():
+@pytest.mark.asyncio
+async def test_multiple_link_relations():
     app = FastAPI()
 
     app.add_middleware(
@@ -32,15 +34,17 @@ def test_multiple_link_relations():
     def test_v2():
         return {"msg": "v2"}
 
-    client = TestClient(app)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        res1 = await client.get("/api/v1/test")
+        res2 = await client.get("/api/v2/test")
 
-    res1 = client.get("/api/v1/test")
     assert res1.status_code == 200
     assert "Link" in res1.headers
     assert 'rel="deprecation"' in res1.headers["Link"]
     assert 'rel="successor-version"' in res1.headers["Link"]
 
-    res2 = client.get("/api/v2/test")
     assert res2.status_code == 200
     assert "Link" in res2.headers
     assert 'rel="deprecation"' in res2.headers["Link"]
@@ -1,6 +1,7 @@
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from datetime import datetime, timezone, timedelta
 
 from fastapi_deprecation import DeprecationMiddleware, set_deprecation_callback
@@ -46,21 +47,28 @@ def app(memory_tracker):
     return app
 
 
-@pytest.mark.asyncio
-async def test_in_memory_metrics_aggregation(app, memory_tracker):
-    client = TestClient(app)
+@pytest_asyncio.fixture
+async def client(app):
+    # Drive the app on the test's own loop instead of TestClient's portal thread
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        yield client
+
 
+@pytest.mark.asyncio
+async def test_in_memory_metrics_aggregation(client, memory_tracker):
     # Hit the warning endpoint 3 times
-    client.get("/v1/users")
-    client.get("/v1/users")
-    client.get("/v1/users")
+    await client.get("/v1/users")
+    await client.get("/v1/users")
+    await client.get("/v1/users")
 
     # Hit the blocked endpoint 2 times
-    client.get("/v1/payments")
-    client.get("/v1/payments")
+    await client.get("/v1/payments")
+    await client.get("/v1/payments")
 
     # Fetch metrics
-    response = client.get("/metrics")
+    response = await client.get("/metrics")
     assert response.status_code == 200
     metrics = response.json()["fastapi_deprecation_requests_total"]
 
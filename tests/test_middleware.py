@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.testclient import TestClient
 from fastapi_deprecation import (
     DeprecationDependency,
@@ -42,6 +42,8 @@ def test_middleware_injection():
     # v2 is sunset natively (middleware intercepted)
     res2 = client.get("/api/v2/test")
     assert res2.status_code == 410
+    assert res2.headers["content-type"] == "application/json"
+    assert res2.json() == {"detail": "Endpoint is deprecated and no longer available."}
 
     # what if v2 doesn't exist?
     res_not_found = client.get("/api/v2/missing")
@@ -57,7 +59,7 @@ def test_middleware_telemetry():
     calls = []
 
     def my_callback(req, res, dep):
-        calls.append((req.url.path, res.status_code))
+        calls.append((req.url.path, res.status_code, res.headers.get("Deprecation")))
 
     set_deprecation_callback(my_callback)
 
@@ -81,6 +83,7 @@ def test_middleware_telemetry():
     assert len(calls) == 1
     assert calls[0][0] == "/old/test"
     assert calls[0][1] == 200
+    assert calls[0][2] == "@1704067200"
 
     # Trigger sunset
     client.get("/dead/path")
@@ -90,3 +93,93 @@ def test_middleware_telemetry():
 
     # Reset callback for other tests
     _DEPRECATION_CALLBACKS.clear()
+
+
+def test_middleware_merges_existing_headers():
+    app = FastAPI()
+    app.add_middleware(
+        DeprecationMiddleware,
+        deprecations={
+            "/api": DeprecationDependency(
+                deprecation_date="2024-01-01",
+                links={"successor-version": "https://example.com/v2"},
+            ),
+        },
+    )
+
+    @app.get("/api/test")
+    def test_api(response: Response):
+        response.headers["Link"] = '<https://example.com/docs>; rel="help"'
+        response.headers["Deprecation"] = "stale"
+        return {"msg": "api"}
+
+    client = TestClient(app)
+    res = client.get("/api/test")
+
+    assert res.status_code == 200
+    assert res.headers.get_list("Deprecation") == ["@1704067200"]
+    assert res.headers["Link"] == (
+        '<https://example.com/docs>; rel="help", '
+        '<https://example.com/v2>; rel="successor-version"'
+    )
+
+
+def test_middleware_longest_prefix_wins():
+    app = FastAPI()
+
+    app.add_middleware(
+        DeprecationMiddleware,
+        deprecations={
+            "/api": DeprecationDependency(deprecation_date="2024-01-01"),
+            "/api/v1/legacy": DeprecationDependency(sunset_date="2020-01-01"),
+        },
+    )
+
+    @app.get("/api/v1/legacy/items")
+    def legacy_items():
+        return {"msg": "legacy"}
+
+    @app.get("/api/v1/items")
+    def items():
+        return {"msg": "items"}
+
+    @app.get("/other")
+    def other():
+        return {"msg": "other"}
+
+    client = TestClient(app)
+
+    assert client.get("/api/v1/legacy/items").status_code == 410
+
+    res = client.get("/api/v1/items")
+    assert res.status_code == 200
+    assert "Deprecation" in res.headers
+
+    # Shorter than the longest prefix, still matched by "/api"
+    assert "Deprecation" in client.get("/api").headers
+
+    res = client.get("/other")
+    assert res.status_code == 200
+    assert "Deprecation" not in res.headers
+
+
+def test_middleware_sunset_redirect():
+    app = FastAPI()
+
+    app.add_middleware(
+        DeprecationMiddleware,
+        deprecations={
+            "/legacy": DeprecationDependency(
+                sunset_date="2020-01-01", alternative="/current"
+            ),
+        },
+    )
+
+    client = TestClient(app)
+
+    res = client.get("/legacy/items", follow_redirects=False)
+    assert res.status_code == 301
+    assert res.headers["Location"] == "/current"
+    assert res.headers["content-type"] == "text/plain; charset=utf-8"
+    assert res.text == "Endpoint is deprecated and replaced."
+    assert "Sunset" in res.headers
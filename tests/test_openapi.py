@@ -46,3 +46,56 @@ def test_openapi_schema():
     nodate_op = schema["paths"]["/deprecated-nodate"]["get"]
     assert nodate_op["deprecated"] is True
     assert "**DEPRECATED**" in nodate_op.get("description", "")
+
+
+def test_openapi_cached_schema_bytes():
+    cached_app = FastAPI()
+
+    @cached_app.get("/old")
+    @deprecated(deprecation_date="2022-01-01")
+    def old():
+        return {}
+
+    auto_deprecate_openapi(cached_app, always_rebuild=False)
+    cached_client = TestClient(cached_app)
+
+    first = cached_client.get("/openapi.json")
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert first.json()["paths"]["/old"]["get"]["deprecated"] is True
+    assert cached_client.get("/openapi.json").content == first.content
+
+    # Dropping the memoized schema re-encodes the rebuilt one
+    @cached_app.get("/new")
+    def new():
+        return {}
+
+    cached_app._custom_openapi_schema = None
+    assert "/new" in cached_client.get("/openapi.json").json()["paths"]
+
+
+def test_openapi_reflects_replaced_route():
+    replaced_app = FastAPI()
+
+    @replaced_app.get("/a")
+    def a():
+        return {}
+
+    auto_deprecate_openapi(replaced_app)
+    replaced_client = TestClient(replaced_app)
+    paths = replaced_client.get("/openapi.json").json()["paths"]
+    assert "deprecated" not in paths["/a"]["get"]
+
+    # Same route count, different routes
+    replaced_app.router.routes[:] = [
+        route for route in replaced_app.router.routes if route.path != "/a"
+    ]
+
+    @replaced_app.get("/b")
+    @deprecated(deprecation_date="2022-01-01")
+    def b():
+        return {}
+
+    paths = replaced_client.get("/openapi.json").json()["paths"]
+    assert "/a" not in paths
+    assert paths["/b"]["get"]["deprecated"] is True
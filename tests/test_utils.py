@@ -44,3 +44,16 @@ def test_format_sunset_date_http_date():
 def test_parse_date_invalid_str():
     with pytest.raises(ValueError):
         format_deprecation_date("invalid-date-string")
+
+
+def test_parse_date_str_is_memoized():
+    from fastapi_deprecation.utils import parse_date
+
+    first = parse_date("2031-05-04T12:00:00+02:00")
+    assert first == datetime(2031, 5, 4, 10, 0, 0, tzinfo=timezone.utc)
+    assert parse_date("2031-05-04T12:00:00+02:00") is first
+
+
+def test_parse_date_non_iso_str_falls_back_to_dateutil():
+    # Not ISO 8601, so parsed by dateutil rather than fromisoformat()
+    assert format_deprecation_date("12 Oct 2023 10:00:00") == "@1697104800"
@@ -203,3 +203,68 @@ def test_websocket_mid_session_block():
             websocket.receive_text()  # Wait to observe the closure from the server
 
     assert exc_info.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+@pytest.mark.asyncio
+async def test_websocket_block_redirect_messages():
+    from fastapi_deprecation.engine import (
+        DeprecationConfig,
+        process_deprecation,
+        send_websocket_block_response,
+    )
+
+    config = DeprecationConfig(
+        sunset_date=datetime.now(timezone.utc) - timedelta(days=1),
+        alternative="/ws/v2",
+    )
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await send_websocket_block_response(config, process_deprecation(config), send)
+
+    start, body = messages
+    headers = dict(start["headers"])
+    assert start["status"] == 301
+    assert headers[b"location"] == b"/ws/v2"
+    assert headers[b"content-length"] == str(len(body["body"])).encode()
+    assert b"sunset" in headers
+    assert body["body"] == b"Endpoint is deprecated and replaced."
+
+
+@pytest.mark.asyncio
+async def test_websocket_block_telemetry_headers_not_shared(monkeypatch, caplog):
+    from fastapi_deprecation import engine
+    from fastapi_deprecation.engine import DeprecationConfig
+
+    def tamper(request, response, dep):
+        response.raw_headers.append((b"x-leak", b"1"))
+
+    monkeypatch.setattr(engine, "_DEPRECATION_CALLBACKS", [tamper])
+
+    middleware = DeprecationMiddleware(
+        None,
+        deprecations={
+            "/ws": DeprecationConfig(
+                sunset_date=datetime.now(timezone.utc) - timedelta(days=1)
+            )
+        },
+    )
+    scope = {"type": "websocket", "path": "/ws/test", "headers": []}
+
+    async def receive():
+        return {"type": "websocket.connect"}
+
+    for _ in range(2):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, receive, send)
+        assert messages[0]["status"] == 410
+        assert b"x-leak" not in dict(messages[0]["headers"])
+
+    # The callback got a list it may edit
+    assert "Telemetry callback failed" not in caplog.text